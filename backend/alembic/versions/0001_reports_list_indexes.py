@@ -0,0 +1,27 @@
+"""Indexes for report list pagination and snapshot lookups
+
+Revision ID: 0001
+Revises: 
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # IF NOT EXISTS: tables created by init_db (create_all) already have them
+    op.execute("CREATE INDEX IF NOT EXISTS ix_reports_created_at_id ON reports (created_at, id)")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_report_project_snapshots_report_id ON report_project_snapshots (report_id)")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_report_project_snapshots_report_id")
+    op.execute("DROP INDEX IF EXISTS ix_reports_created_at_id")
@@ -0,0 +1,24 @@
+"""Report change counter for ETags
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE reports ADD COLUMN IF NOT EXISTS change_counter INTEGER NOT NULL DEFAULT 0")
+
+
+def downgrade() -> None:
+    op.drop_column('reports', 'change_counter')
@@ -0,0 +1,27 @@
+"""Unique (report_id, version_number) index for delta-encoded versions
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS ix_report_versions_report_id_version_number "
+        "ON report_versions (report_id, version_number)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_report_versions_report_id_version_number")
@@ -0,0 +1,27 @@
+"""Indexes for per-project subscription and one-time revenue list pagination
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # IF NOT EXISTS: tables created by init_db (create_all) already have them
+    op.execute("CREATE INDEX IF NOT EXISTS ix_subscriptions_project_id_id ON subscriptions (project_id, id)")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_revenue_one_time_project_id_id ON revenue_one_time (project_id, id)")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_revenue_one_time_project_id_id")
+    op.execute("DROP INDEX IF EXISTS ix_subscriptions_project_id_id")
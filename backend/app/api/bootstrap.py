@@ -0,0 +1,88 @@
+"""Bootstrap API endpoint: reference data and KPIs for the dashboard pages in one payload."""
+
+from fastapi import APIRouter, Depends, Request, Response, status
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from typing import Any, Dict, List
+
+import orjson
+
+from ..database import get_db
+from ..models.project import Client, Project, ProjectFinancialSummary, Stakeholder, TeamMember
+from ..models.report import Report, ReportStatus
+from ..services.cache import LRUCache, cache_key, table_markers
+from ..services.financial_summary_service import portfolio_totals
+from ..services.pregeneration_service import INACTIVE_STATUSES
+from .auth import get_current_user
+from .params import etag_matches
+
+router = APIRouter(prefix="/api/bootstrap", tags=["bootstrap"])
+
+# Tables whose rows feed the payload (a change to any of them changes the version)
+VERSIONED_MODELS = (Project, Client, TeamMember, Stakeholder, ProjectFinancialSummary, Report)
+
+# Rendered payloads by version (shared by all users, the payload is not per-user)
+_payload_cache = LRUCache(maxsize=4)
+
+
+@router.get("")
+def get_bootstrap(
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    """Projects, clients, team members, stakeholders and summary KPIs in one response.
+
+    The response carries a version token (also sent as a weak ETag). Clients
+    keep the payload and revalidate with If-None-Match, which costs a single
+    query and returns 304 until some reference data changes.
+    """
+    version = _data_version(db)
+    etag = f'W/"bootstrap-{version}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    content = _payload_cache.get_or_set(version, lambda: orjson.dumps(_build_payload(db, version)))
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
+def _data_version(db: Session) -> str:
+    """Version token: row count and last change of every table in the payload (one query)."""
+    markers = table_markers(db, VERSIONED_MODELS)
+    return cache_key(*[value.isoformat() if hasattr(value, "isoformat") else value for value in markers])[:16]
+
+
+def _rows(db: Session, *columns) -> List[Dict[str, Any]]:
+    return [dict(row._mapping) for row in db.query(*columns).order_by(columns[0])]
+
+
+def _build_payload(db: Session, version: str) -> Dict[str, Any]:
+    projects = _rows(db, Project.id, Project.name, Project.project_type, Project.status)
+
+    by_status: Dict[str, int] = {}
+    for project in projects:
+        by_status[project["status"].value] = by_status.get(project["status"].value, 0) + 1
+
+    totals = portfolio_totals(db)
+    report_counts = dict(db.query(Report.status, func.count(Report.id)).group_by(Report.status).all())
+
+    return {
+        "version": version,
+        "projects": projects,
+        "clients": _rows(db, Client.id, Client.name),
+        "team_members": _rows(db, TeamMember.id, TeamMember.full_name, TeamMember.role, TeamMember.email),
+        "stakeholders": _rows(db, Stakeholder.id, Stakeholder.name),
+        "kpis": {
+            "projects_total": len(projects),
+            "projects_active": sum(count for name, count in by_status.items() if name not in INACTIVE_STATUSES),
+            "projects_by_status": by_status,
+            "revenue_capex": float(totals["revenue_capex"]),
+            "revenue_subscription": float(totals["revenue_subscription"]),
+            "saving_subscription": float(totals["saving_subscription"]),
+            "costs_total": float(totals["cost_internal"] + totals["cost_vendor"] + totals["cost_infrastructure"]),
+            "reports_total": sum(report_counts.values()),
+            "reports_draft": report_counts.get(ReportStatus.DRAFT.value, 0),
+            "reports_final": report_counts.get(ReportStatus.FINAL.value, 0),
+        },
+    }
@@ -1,26 +1,31 @@
 """Clients CRUD API endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from datetime import datetime, timezone
 
 from ..database import get_db
 from ..models.project import Client
 from ..schemas.client import ClientCreate, ClientUpdate, ClientResponse
+from .pagination import keyset_page
 
 router = APIRouter(prefix="/api/clients", tags=["clients"])
 
 
 @router.get("/", response_model=List[ClientResponse])
 async def list_clients(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=500),
     db: Session = Depends(get_db)
 ):
-    """List all clients."""
-    clients = db.query(Client).offset(skip).limit(limit).all()
-    return clients
+    """List all clients.
+
+    Keyset-paginated by id: pass the X-Next-Cursor response header back as
+    `cursor` while X-Has-More is "true".
+    """
+    return keyset_page(db.query(Client), (Client.id,), cursor, limit, response)
 
 
 @router.get("/{client_id}", response_model=ClientResponse)
@@ -0,0 +1,83 @@
+"""Keyset (cursor) pagination shared by the list endpoints.
+
+Pages are selected with a row-value comparison on an indexed, unique sort
+key - e.g. WHERE (created_at, id) < (:created_at, :id) ORDER BY created_at
+DESC, id DESC LIMIT n + 1 - so every page costs the same however deep it
+is, and rows inserted or deleted meanwhile do not shift later pages.
+
+Responses stay plain JSON lists; paging state travels in headers:
+X-Has-More ("true"/"false") and, when there is a next page, X-Next-Cursor,
+an opaque token to pass back as the `cursor` query parameter.
+"""
+
+from datetime import date, datetime
+from typing import Any, List, Optional, Sequence
+import base64
+
+import orjson
+from fastapi import HTTPException, Response
+from sqlalchemy import tuple_
+
+
+def encode_cursor(*values: Any) -> str:
+    """Opaque cursor for the sort key values of the last row of a page."""
+    payload = orjson.dumps([value.isoformat() if isinstance(value, (date, datetime)) else value for value in values])
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, columns: Sequence) -> List[Any]:
+    """Decode a cursor back into sort key values, typed like the key columns (400 if invalid)."""
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = orjson.loads(payload)
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise ValueError("cursor does not match the sort key")
+
+        decoded = []
+        for column, value in zip(columns, values):
+            python_type = column.type.python_type
+            if python_type in (date, datetime):
+                decoded.append(python_type.fromisoformat(value))
+            else:
+                decoded.append(python_type(value))
+        return decoded
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def keyset_page(
+    query,
+    key: Sequence,
+    cursor: Optional[str],
+    limit: int,
+    response: Response,
+    descending: bool = False
+) -> list:
+    """
+    Fetch one page of a query ordered by a unique key
+
+    Args:
+        query: ORM query with filters applied (no ordering or limit)
+        key: Sort key columns; the last one must make the key unique (usually id)
+        cursor: Cursor from a previous page's X-Next-Cursor header, if any
+        limit: Page size
+        response: Response whose X-Has-More / X-Next-Cursor headers are set
+        descending: Sort newest/largest first
+
+    Returns:
+        The rows (or entities) of the page
+    """
+    if cursor:
+        bound = tuple_(*decode_cursor(cursor, key))
+        query = query.filter(tuple_(*key) < bound if descending else tuple_(*key) > bound)
+
+    order = [column.desc() for column in key] if descending else list(key)
+    rows = query.order_by(*order).limit(limit + 1).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    response.headers["X-Has-More"] = "true" if has_more else "false"
+    if has_more:
+        last = rows[-1]
+        response.headers["X-Next-Cursor"] = encode_cursor(*(getattr(last, column.key) for column in key))
+    return rows
@@ -0,0 +1,26 @@
+"""Request helpers shared by the API routers (query parameters, conditional requests)."""
+
+from fastapi import HTTPException, Request
+from typing import List, Optional
+
+
+def parse_field_list(value: Optional[str], allowed: tuple, name: str) -> Optional[List[str]]:
+    """Parse a comma-separated query parameter (None if not given)."""
+    if value is None:
+        return None
+    items = list(dict.fromkeys(item.strip() for item in value.split(",") if item.strip()))
+    unknown = [item for item in items if item not in allowed]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown {name}: {', '.join(unknown)}")
+    return items
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Weak comparison of an ETag against the If-None-Match header."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in header.split(","))
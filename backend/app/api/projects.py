@@ -1,47 +1,82 @@
 """Projects CRUD API endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, status, Request
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status, Request
+from sqlalchemy import delete
+from sqlalchemy.orm import Session, joinedload, selectinload
+from typing import List, Optional
 from datetime import datetime, timezone
 
 from ..database import get_db
-from ..models.project import Project, ProjectActivity, ProjectCost
+from ..models.project import Project, ProjectActivity, ProjectClient, ProjectCost, ProjectStakeholder, ProjectTeam
+from ..services.financial_summary_service import refresh_project_financials
 from ..schemas.project import (
-    ProjectCreate, ProjectUpdate, ProjectResponse,
+    ProjectCreate, ProjectUpdate, ProjectResponse, ProjectListResponse, ProjectDetailResponse,
     ProjectActivityCreate, ProjectActivityUpdate, ProjectActivityResponse,
     ProjectCostCreate, ProjectCostUpdate, ProjectCostResponse
 )
 from .auth import get_current_user
+from .pagination import keyset_page
+from .params import parse_field_list
 
 router = APIRouter(prefix="/api/projects", tags=["projects"])
 
+# ?include= names -> Project relationships
+PROJECT_INCLUDES = {
+    "activities": "activities",
+    "costs": "costs",
+    "subscriptions": "subscriptions",
+    "revenue": "revenue_one_time",
+    "team": "team",
+    "clients": "clients",
+    "stakeholders": "stakeholders",
+    "financial_summary": "financial_summary",
+}
+
 
 # ==================== PROJECTS ====================
 
-@router.get("/", response_model=List[ProjectResponse])
+@router.get("/", response_model=List[ProjectListResponse])
 async def list_projects(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=500),
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
-    """List all projects."""
-    projects = db.query(Project).offset(skip).limit(limit).all()
-    return projects
+    """List all projects with their financial totals.
+
+    Keyset-paginated by id: pass the X-Next-Cursor response header back as
+    `cursor` while X-Has-More is "true".
+    """
+    query = db.query(Project).options(joinedload(Project.financial_summary))
+    return keyset_page(query, (Project.id,), cursor, limit, response)
 
 
-@router.get("/{project_id}", response_model=ProjectResponse)
+@router.get("/{project_id}", response_model=ProjectDetailResponse, response_model_exclude_unset=True)
 async def get_project(
     project_id: int,
+    include: Optional[str] = Query(None, description=f"Comma-separated children to embed: {', '.join(PROJECT_INCLUDES)}"),
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
-    """Get a specific project by ID."""
-    project = db.query(Project).filter(Project.id == project_id).first()
+    """Get a specific project by ID, optionally with its children.
+    
+    Each included child collection is eager-loaded with one query, so the
+    whole page is a fixed number of queries regardless of row counts.
+    """
+    includes = parse_field_list(include, PROJECT_INCLUDES, "include") or []
+    
+    query = db.query(Project).filter(Project.id == project_id)
+    for name in includes:
+        query = query.options(_include_loader(name))
+    project = query.first()
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
-    return project
+    
+    data = ProjectResponse.model_validate(project).model_dump()
+    for name in includes:
+        data[name] = getattr(project, PROJECT_INCLUDES[name])
+    return ProjectDetailResponse.model_validate(data, from_attributes=True)
 
 
 @router.post("/", response_model=ProjectResponse, status_code=status.HTTP_201_CREATED)
@@ -53,6 +88,8 @@ async def create_project(
     """Create a new project."""
     db_project = Project(**project.dict())
     db.add(db_project)
+    db.flush()
+    refresh_project_financials(db, [db_project.id])
     db.commit()
     db.refresh(db_project)
     return db_project
@@ -85,12 +122,11 @@ async def delete_project(
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
-    """Delete a project."""
-    db_project = db.query(Project).filter(Project.id == project_id).first()
-    if not db_project:
+    """Delete a project (its children go with it via ON DELETE CASCADE)."""
+    result = db.execute(delete(Project).where(Project.id == project_id))
+    if not result.rowcount:
         raise HTTPException(status_code=404, detail="Project not found")
     
-    db.delete(db_project)
     db.commit()
     return None
 
@@ -175,6 +211,8 @@ async def create_project_cost(
     
     db_cost = ProjectCost(**cost.dict(), project_id=project_id)
     db.add(db_cost)
+    db.flush()
+    refresh_project_financials(db, [project_id])
     db.commit()
     db.refresh(db_cost)
     return db_cost
@@ -194,6 +232,8 @@ async def update_project_cost(
     for key, value in cost.dict(exclude_unset=True).items():
         setattr(db_cost, key, value)
     
+    db.flush()
+    refresh_project_financials(db, [db_cost.project_id])
     db.commit()
     db.refresh(db_cost)
     return db_cost
@@ -207,5 +247,22 @@ async def delete_project_cost(cost_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Cost not found")
     
     db.delete(db_cost)
+    db.flush()
+    refresh_project_financials(db, [db_cost.project_id])
     db.commit()
     return None
+
+
+# ==================== HELPERS ====================
+
+def _include_loader(name: str):
+    """Eager-load option for an ?include= child (association rows bring their target)."""
+    if name == "team":
+        return selectinload(Project.team).joinedload(ProjectTeam.team_member)
+    if name == "clients":
+        return selectinload(Project.clients).joinedload(ProjectClient.client)
+    if name == "stakeholders":
+        return selectinload(Project.stakeholders).joinedload(ProjectStakeholder.stakeholder)
+    if name == "financial_summary":
+        return joinedload(Project.financial_summary)
+    return selectinload(getattr(Project, PROJECT_INCLUDES[name]))
@@ -1,14 +1,27 @@
 """Reports API endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
-from datetime import datetime
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException, Path, Query, Request, Response, status
+from sqlalchemy import delete, func, insert, literal, select
+from sqlalchemy.orm import Session, load_only
+from typing import List, Optional
+from datetime import date, datetime
+
+import orjson
+from pydantic_core import to_json
 
 from ..database import get_db
 from ..models.report import Report, ReportProjectSnapshot, ReportExecutiveSummary, ReportTemplate, ReportStatus
 from ..models.project import Project
 from ..schemas import report as schemas
+from ..services.cache import bump_change_counter, cache_key
+from ..services.idempotency_service import IdempotencyClaim, IdempotencyConflictError, IdempotencyService
+from .pagination import keyset_page
+from .params import etag_matches, parse_field_list
+
+# Fields accepted by the sparse `fields` / `include` query parameters
+REPORT_FIELDS = tuple(name for name in schemas.Report.model_fields if name not in ("project_snapshots", "executive_summary"))
+REPORT_INCLUDES = ("project_snapshots", "executive_summary")
+SNAPSHOT_FIELDS = tuple(schemas.ReportProjectSnapshot.model_fields)
 
 router = APIRouter(prefix="/api/reports", tags=["reports"])
 
@@ -76,23 +89,65 @@ def delete_template(template_id: int, db: Session = Depends(get_db)):
 # ============================================================================
 
 @router.get("/", response_model=List[schemas.ReportList])
-def list_reports(db: Session = Depends(get_db)):
-    """List all reports with basic info."""
-    reports = db.query(Report).order_by(Report.created_at.desc()).all()
+def list_reports(
+    response: Response,
+    status_filter: Optional[str] = Query(None, alias="status"),
+    period_from: Optional[date] = None,
+    period_to: Optional[date] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=500),
+    db: Session = Depends(get_db)
+):
+    """List reports with basic info, newest first.
+    
+    Keyset-paginated: pass the X-Next-Cursor response header back as
+    `cursor` while X-Has-More is "true". period_from/period_to keep reports
+    whose period overlaps the given range.
+    """
+    projects_count = select(func.count(ReportProjectSnapshot.id)).where(
+        ReportProjectSnapshot.report_id == Report.id
+    ).correlate(Report).scalar_subquery()
+    
+    query = db.query(
+        Report.id,
+        Report.name,
+        Report.period_start,
+        Report.period_end,
+        Report.status,
+        Report.pdf_path,
+        Report.pdf_generated_at,
+        Report.created_at,
+        Report.updated_at,
+        projects_count.label("projects_count")
+    )
     
-    # Add projects count
-    result = []
-    for report in reports:
-        report_data = schemas.ReportList.model_validate(report)
-        report_data.projects_count = len(report.project_snapshots)
-        result.append(report_data)
+    if status_filter:
+        query = query.filter(Report.status == status_filter)
+    if period_from:
+        query = query.filter(Report.period_end >= period_from)
+    if period_to:
+        query = query.filter(Report.period_start <= period_to)
     
-    return result
+    rows = keyset_page(query, (Report.created_at, Report.id), cursor, limit, response, descending=True)
+    return [schemas.ReportList.model_validate(row._mapping) for row in rows]
 
 
 @router.post("/", response_model=schemas.Report, status_code=status.HTTP_201_CREATED)
-def create_report(report: schemas.ReportCreate, db: Session = Depends(get_db)):
-    """Create a new report with project snapshots."""
+def create_report(
+    report: schemas.ReportCreate,
+    idempotency_key: Optional[str] = Header(None, max_length=255),
+    db: Session = Depends(get_db)
+):
+    """Create a new report with project snapshots.
+    
+    Retries carrying the same Idempotency-Key return the original report.
+    """
+    from ..services.snapshot_service import SnapshotService
+    from ..services.summary_service import sum_totals
+    
+    claim = _claim_idempotency_key(db, idempotency_key, "create_report", report)
+    if claim and claim.is_replay:
+        return _replayed(db, Report, claim)
     
     # Get template config if specified
     template_config = report.template_config
@@ -113,31 +168,71 @@ def create_report(report: schemas.ReportCreate, db: Session = Depends(get_db)):
     db.add(db_report)
     db.flush()  # Get report ID
     
-    # Create project snapshots
+    # Create project snapshots (one bulk insert for all projects)
+    rows = []
     if report.project_ids:
-        for idx, project_id in enumerate(report.project_ids):
-            project = db.query(Project).filter(Project.id == project_id).first()
-            if project:
-                # Create snapshot from current project data
-                snapshot = _create_project_snapshot(db_report.id, project, idx, db)
-                db.add(snapshot)
-    
-    # Create executive summary (empty for now, will be calculated)
-    exec_summary = ReportExecutiveSummary(report_id=db_report.id)
+        rows = SnapshotService().create_snapshots(db, db_report.id, report.project_ids)
+    
+    # Create executive summary with the totals of the new snapshots
+    revenue, saving = sum_totals(row["financial_data"] for row in rows)
+    exec_summary = ReportExecutiveSummary(
+        report_id=db_report.id,
+        actual_revenue_total=revenue,
+        actual_saving_total=saving,
+        actual_projects_count=len(rows)
+    )
     db.add(exec_summary)
     
+    if claim:
+        IdempotencyService().complete(db, claim, db_report.id)
+    
     db.commit()
     db.refresh(db_report)
     return db_report
 
 
 @router.get("/{report_id}", response_model=schemas.Report)
-def get_report(report_id: int, db: Session = Depends(get_db)):
-    """Get a specific report with all details."""
-    report = db.query(Report).filter(Report.id == report_id).first()
-    if not report:
+def get_report(
+    report_id: int,
+    request: Request,
+    response: Response,
+    include: Optional[str] = None,
+    fields: Optional[str] = None,
+    db: Session = Depends(get_db)
+):
+    """Get a specific report with all details.
+    
+    Supports conditional GET: an unchanged report answers 304 to
+    If-None-Match after a single indexed lookup.
+    
+    Sparse responses: `include` lists the related data to embed
+    (project_snapshots, executive_summary; default both) and `fields` the
+    snapshot fields to return. Snapshot columns that are not requested
+    (notably the JSONB ones) are never fetched from the database.
+    """
+    includes = parse_field_list(include, REPORT_INCLUDES, "include")
+    snapshot_fields = parse_field_list(fields, SNAPSHOT_FIELDS, "fields")
+    
+    etag = _report_etag(db, report_id, _representation("report", includes, snapshot_fields))
+    if etag is None:
         raise HTTPException(status_code=404, detail="Report not found")
-    return report
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    
+    report = db.query(Report).filter(Report.id == report_id).first()
+    if includes is None and snapshot_fields is None:
+        response.headers["ETag"] = etag
+        return report
+    
+    includes = REPORT_INCLUDES if includes is None else includes
+    data = {field: getattr(report, field) for field in REPORT_FIELDS}
+    if "project_snapshots" in includes:
+        data["project_snapshots"] = _snapshot_dicts(db, report_id, snapshot_fields)
+    if "executive_summary" in includes:
+        summary = report.executive_summary
+        data["executive_summary"] = schemas.ReportExecutiveSummary.model_validate(summary) if summary else None
+    
+    return Response(content=to_json(data), media_type="application/json", headers={"ETag": etag})
 
 
 @router.put("/{report_id}", response_model=schemas.Report)
@@ -151,6 +246,7 @@ def update_report(report_id: int, report: schemas.ReportUpdate, db: Session = De
     for field, value in update_data.items():
         setattr(db_report, field, value)
     
+    bump_change_counter(db, report_id)
     db.commit()
     db.refresh(db_report)
     return db_report
@@ -158,19 +254,77 @@ def update_report(report_id: int, report: schemas.ReportUpdate, db: Session = De
 
 @router.delete("/{report_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_report(report_id: int, db: Session = Depends(get_db)):
-    """Delete a report."""
-    db_report = db.query(Report).filter(Report.id == report_id).first()
-    if not db_report:
+    """Delete a report (snapshots, summary and versions go with it via ON DELETE CASCADE)."""
+    result = db.execute(delete(Report).where(Report.id == report_id))
+    if not result.rowcount:
         raise HTTPException(status_code=404, detail="Report not found")
     
-    db.delete(db_report)
     db.commit()
     return
 
 
+@router.post("/month-close")
+def run_month_close(request: schemas.MonthCloseRequest, db: Session = Depends(get_db)):
+    """Run the month-close pipeline, streaming one NDJSON event per report and stage.
+    
+    Stages are checkpointed, so running the same period again resumes
+    where a failed or interrupted run stopped. The request is validated and
+    the period's draft created before streaming starts.
+    """
+    from fastapi.responses import StreamingResponse
+    from ..services.month_close_service import MonthCloseNotFoundError, MonthClosePipeline
+    from ..services.pregeneration_service import month_period
+    
+    year, month = (int(part) for part in request.period.split("-"))
+    period_start, period_end = month_period(year, month)
+    pipeline = MonthClosePipeline(finalize=request.finalize)
+    try:
+        reports = pipeline.prepare(
+            db, period_start, period_end, report_ids=request.report_ids, template_id=request.template_id
+        )
+    except MonthCloseNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    db.commit()
+    events = pipeline.run(period_start, reports)
+    return StreamingResponse(
+        (orjson.dumps(event) + b"\n" for event in events),
+        media_type="application/x-ndjson"
+    )
+
+
+@router.post("/archive", response_model=schemas.ReportArchiveResult)
+def archive_reports(request: schemas.ReportArchiveRequest, db: Session = Depends(get_db)):
+    """Copy matching reports into report_archives and delete them, in one statement."""
+    from ..services.archive_service import ReportArchiveService
+    
+    service = ReportArchiveService()
+    try:
+        report_ids = service.archive(
+            db, report_ids=request.report_ids, before=request.before, status=request.status
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    db.commit()
+    service.discard_artifacts(report_ids)
+    return {"archived_count": len(report_ids), "report_ids": report_ids}
+
+
 @router.post("/{report_id}/copy", response_model=schemas.Report, status_code=status.HTTP_201_CREATED)
-def copy_report(report_id: int, copy_data: schemas.ReportCopy, db: Session = Depends(get_db)):
-    """Create a copy of an existing report with new period."""
+def copy_report(
+    report_id: int,
+    copy_data: schemas.ReportCopy,
+    idempotency_key: Optional[str] = Header(None, max_length=255),
+    db: Session = Depends(get_db)
+):
+    """Create a copy of an existing report with new period (honors Idempotency-Key)."""
+    claim = _claim_idempotency_key(db, idempotency_key, f"copy_report:{report_id}", copy_data)
+    if claim and claim.is_replay:
+        return _replayed(db, Report, claim)
+    
     original = db.query(Report).filter(Report.id == report_id).first()
     if not original:
         raise HTTPException(status_code=404, detail="Report not found")
@@ -187,85 +341,192 @@ def copy_report(report_id: int, copy_data: schemas.ReportCopy, db: Session = Dep
     db.add(new_report)
     db.flush()
     
-    # Copy project snapshots
-    for snapshot in original.project_snapshots:
-        new_snapshot = ReportProjectSnapshot(
-            report_id=new_report.id,
-            project_id=snapshot.project_id,
-            sort_order=snapshot.sort_order,
-            name=snapshot.name,
-            project_type=snapshot.project_type,
-            status=snapshot.status,
-            description=snapshot.description,
-            start_date=snapshot.start_date,
-            end_date=snapshot.end_date,
-            financial_data=snapshot.financial_data,
-            team_data=snapshot.team_data,
-            stakeholder_data=snapshot.stakeholder_data,
-            client_data=snapshot.client_data,
-            activities_data=snapshot.activities_data,
-            notes=snapshot.notes,
-            custom_fields=snapshot.custom_fields
+    # Copy project snapshots and executive summary server-side (INSERT ... SELECT),
+    # so JSONB payloads never travel through the application
+    snapshot_columns = [
+        'project_id', 'sort_order', 'name', 'project_type', 'status', 'description',
+        'start_date', 'end_date', 'financial_data', 'team_data', 'stakeholder_data',
+        'client_data', 'activities_data', 'notes', 'custom_fields'
+    ]
+    db.execute(
+        insert(ReportProjectSnapshot).from_select(
+            ['report_id'] + snapshot_columns,
+            select(
+                literal(new_report.id),
+                *[getattr(ReportProjectSnapshot, column) for column in snapshot_columns]
+            ).where(
+                ReportProjectSnapshot.report_id == report_id
+            ).order_by(ReportProjectSnapshot.sort_order, ReportProjectSnapshot.id)
         )
-        db.add(new_snapshot)
-    
-    # Copy executive summary
-    if original.executive_summary:
-        new_summary = ReportExecutiveSummary(
-            report_id=new_report.id,
-            actual_revenue_total=original.executive_summary.actual_revenue_total,
-            actual_saving_total=original.executive_summary.actual_saving_total,
-            actual_projects_count=original.executive_summary.actual_projects_count,
-            forecast_revenue_total=original.executive_summary.forecast_revenue_total,
-            forecast_saving_total=original.executive_summary.forecast_saving_total,
-            forecast_projects_count=original.executive_summary.forecast_projects_count,
-            notes=original.executive_summary.notes
+    )
+    
+    summary_columns = [
+        'actual_revenue_total', 'actual_saving_total', 'actual_projects_count',
+        'forecast_revenue_total', 'forecast_saving_total', 'forecast_projects_count', 'notes'
+    ]
+    db.execute(
+        insert(ReportExecutiveSummary).from_select(
+            ['report_id'] + summary_columns,
+            select(
+                literal(new_report.id),
+                *[getattr(ReportExecutiveSummary, column) for column in summary_columns]
+            ).where(ReportExecutiveSummary.report_id == report_id)
         )
-        db.add(new_summary)
+    )
+    
+    if claim:
+        IdempotencyService().complete(db, claim, new_report.id)
     
     db.commit()
     db.refresh(new_report)
     return new_report
 
 
+@router.get("/{report_id}/diff/{other_report_id}", response_model=schemas.ReportDiff)
+def diff_reports(report_id: int, other_report_id: int, db: Session = Depends(get_db)):
+    """Compare two reports project by project (report_id is the baseline)."""
+    from ..services.diff_service import ReportDiffService
+    
+    reports = {r.id: r for r in db.query(Report).filter(Report.id.in_([report_id, other_report_id]))}
+    if report_id not in reports or other_report_id not in reports:
+        raise HTTPException(status_code=404, detail="Report not found")
+    
+    return ReportDiffService().diff(db, reports[report_id], reports[other_report_id])
+
+
 # ============================================================================
 # PROJECT SNAPSHOTS
 # ============================================================================
 
 @router.get("/{report_id}/projects", response_model=List[schemas.ReportProjectSnapshot])
-def list_report_projects(report_id: int, db: Session = Depends(get_db)):
-    """Get all project snapshots in a report."""
-    report = db.query(Report).filter(Report.id == report_id).first()
-    if not report:
+def list_report_projects(
+    report_id: int,
+    request: Request,
+    response: Response,
+    fields: Optional[str] = None,
+    db: Session = Depends(get_db)
+):
+    """Get all project snapshots in a report (supports If-None-Match).
+    
+    `fields` (comma-separated) returns only those snapshot fields plus id;
+    unrequested columns are not fetched.
+    """
+    snapshot_fields = parse_field_list(fields, SNAPSHOT_FIELDS, "fields")
+    
+    etag = _report_etag(db, report_id, _representation("snapshots", None, snapshot_fields))
+    if etag is None:
         raise HTTPException(status_code=404, detail="Report not found")
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    
+    if snapshot_fields is not None:
+        content = to_json(_snapshot_dicts(db, report_id, snapshot_fields))
+        return Response(content=content, media_type="application/json", headers={"ETag": etag})
     
-    return report.project_snapshots
+    response.headers["ETag"] = etag
+    return db.query(ReportProjectSnapshot).filter(
+        ReportProjectSnapshot.report_id == report_id
+    ).order_by(ReportProjectSnapshot.sort_order, ReportProjectSnapshot.id).all()
 
 
 @router.post("/{report_id}/projects", response_model=schemas.ReportProjectSnapshot, status_code=status.HTTP_201_CREATED)
-def add_project_to_report(report_id: int, snapshot: schemas.ReportProjectSnapshotCreate, db: Session = Depends(get_db)):
-    """Add a project snapshot to report."""
+def add_project_to_report(
+    report_id: int,
+    snapshot: schemas.ReportProjectSnapshotCreate,
+    idempotency_key: Optional[str] = Header(None, max_length=255),
+    db: Session = Depends(get_db)
+):
+    """Add a project snapshot to report (honors Idempotency-Key)."""
+    from ..services.snapshot_service import SnapshotService
+    from ..services.summary_service import apply_snapshot_change
+    
     report = db.query(Report).filter(Report.id == report_id).first()
     if not report:
         raise HTTPException(status_code=404, detail="Report not found")
     
+    claim = _claim_idempotency_key(db, idempotency_key, f"add_project:{report_id}", snapshot)
+    if claim and claim.is_replay:
+        return _replayed(db, ReportProjectSnapshot, claim)
+    
     # If project_id provided, create snapshot from existing project
     if snapshot.project_id:
-        project = db.query(Project).filter(Project.id == snapshot.project_id).first()
-        if project:
-            db_snapshot = _create_project_snapshot(report_id, project, snapshot.sort_order, db)
-        else:
+        db_snapshot = SnapshotService().build_snapshot(db, report_id, snapshot.project_id, snapshot.sort_order)
+        if not db_snapshot:
             raise HTTPException(status_code=404, detail="Project not found")
     else:
         # Create snapshot from provided data
         db_snapshot = ReportProjectSnapshot(report_id=report_id, **snapshot.model_dump(exclude={"project_id"}))
     
     db.add(db_snapshot)
+    db.flush()
+    apply_snapshot_change(db, report_id, None, db_snapshot.financial_data, projects_count=1)
+    
+    if claim:
+        IdempotencyService().complete(db, claim, db_snapshot.id)
+    
+    bump_change_counter(db, report_id)
     db.commit()
     db.refresh(db_snapshot)
     return db_snapshot
 
 
+@router.patch("/{report_id}/projects", response_model=List[schemas.ReportProjectSnapshot])
+def bulk_update_project_snapshots(
+    report_id: int,
+    bulk: schemas.ReportProjectSnapshotBulkUpdate,
+    db: Session = Depends(get_db)
+):
+    """Update many project snapshots at once (edits, reordering) in one transaction."""
+    from ..services.snapshot_service import SnapshotService
+    
+    report = db.query(Report.id).filter(Report.id == report_id).first()
+    if not report:
+        raise HTTPException(status_code=404, detail="Report not found")
+    
+    changes = [item.model_dump(exclude_unset=True) for item in bulk.snapshots]
+    try:
+        ids = SnapshotService().bulk_update(db, report_id, changes, sync_projects=bulk.sync_projects)
+    except ValueError as e:
+        db.rollback()
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    bump_change_counter(db, report_id)
+    db.commit()
+    
+    return db.query(ReportProjectSnapshot).filter(
+        ReportProjectSnapshot.id.in_(ids)
+    ).order_by(ReportProjectSnapshot.sort_order, ReportProjectSnapshot.id).all()
+
+
+@router.post("/{report_id}/refresh-snapshots", response_model=schemas.ReportSnapshotRefreshResult)
+def refresh_project_snapshots(
+    report_id: int,
+    refresh: schemas.ReportSnapshotRefresh,
+    db: Session = Depends(get_db)
+):
+    """Re-derive snapshots from current project data (notes and custom fields are kept)."""
+    from ..services.snapshot_service import SnapshotService
+    
+    report = db.query(Report.id).filter(Report.id == report_id).first()
+    if not report:
+        raise HTTPException(status_code=404, detail="Report not found")
+    
+    try:
+        result = SnapshotService().refresh(
+            db, report_id,
+            snapshot_ids=refresh.snapshot_ids,
+            fields=refresh.fields,
+            policy=refresh.policy
+        )
+    except ValueError as e:
+        db.rollback()
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    bump_change_counter(db, report_id)
+    db.commit()
+    return result
+
+
 @router.put("/{report_id}/projects/{snapshot_id}", response_model=schemas.ReportProjectSnapshot)
 def update_project_snapshot(
     report_id: int,
@@ -274,6 +535,8 @@ def update_project_snapshot(
     db: Session = Depends(get_db)
 ):
     """Update a project snapshot (this is where editing happens!)."""
+    from ..services.summary_service import apply_snapshot_change
+    
     db_snapshot = db.query(ReportProjectSnapshot).filter(
         ReportProjectSnapshot.id == snapshot_id,
         ReportProjectSnapshot.report_id == report_id
@@ -282,10 +545,15 @@ def update_project_snapshot(
     if not db_snapshot:
         raise HTTPException(status_code=404, detail="Snapshot not found")
     
+    old_financial_data = db_snapshot.financial_data
     update_data = snapshot.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(db_snapshot, field, value)
     
+    if "financial_data" in update_data:
+        apply_snapshot_change(db, report_id, old_financial_data, db_snapshot.financial_data)
+    
+    bump_change_counter(db, report_id)
     db.commit()
     db.refresh(db_snapshot)
     
@@ -299,6 +567,8 @@ def update_project_snapshot(
 @router.delete("/{report_id}/projects/{snapshot_id}", status_code=status.HTTP_204_NO_CONTENT)
 def remove_project_from_report(report_id: int, snapshot_id: int, db: Session = Depends(get_db)):
     """Remove a project snapshot from report."""
+    from ..services.summary_service import apply_snapshot_change
+    
     db_snapshot = db.query(ReportProjectSnapshot).filter(
         ReportProjectSnapshot.id == snapshot_id,
         ReportProjectSnapshot.report_id == report_id
@@ -307,7 +577,9 @@ def remove_project_from_report(report_id: int, snapshot_id: int, db: Session = D
     if not db_snapshot:
         raise HTTPException(status_code=404, detail="Snapshot not found")
     
+    apply_snapshot_change(db, report_id, db_snapshot.financial_data, None, projects_count=-1)
     db.delete(db_snapshot)
+    bump_change_counter(db, report_id)
     db.commit()
     return
 
@@ -334,6 +606,7 @@ def update_executive_summary(
     for field, value in update_data.items():
         setattr(db_summary, field, value)
     
+    bump_change_counter(db, report_id)
     db.commit()
     db.refresh(db_summary)
     return db_summary
@@ -341,43 +614,94 @@ def update_executive_summary(
 
 @router.post("/{report_id}/calculate", response_model=schemas.ReportExecutiveSummary)
 def calculate_executive_summary(report_id: int, db: Session = Depends(get_db)):
-    """Calculate executive summary from project snapshots."""
+    """Recalculate executive summary totals from project snapshots.
+    
+    Totals are maintained incrementally on every snapshot change; this full
+    recompute is only needed to repair a summary that drifted.
+    """
+    from ..services.summary_service import SummaryService
+    
     report = db.query(Report).filter(Report.id == report_id).first()
     if not report:
         raise HTTPException(status_code=404, detail="Report not found")
     
-    if not report.executive_summary:
-        exec_summary = ReportExecutiveSummary(report_id=report_id)
-        db.add(exec_summary)
-    else:
-        exec_summary = report.executive_summary
-    
-    # Calculate totals from snapshots
-    from decimal import Decimal
-    total_revenue = Decimal("0.00")
-    total_saving = Decimal("0.00")
-    
-    for snapshot in report.project_snapshots:
-        if snapshot.financial_data:
-            # Sum up revenue
-            revenue_capex = Decimal(str(snapshot.financial_data.get("revenue_capex", 0)))
-            revenue_subscription = Decimal(str(snapshot.financial_data.get("revenue_subscription", 0)))
-            total_revenue += revenue_capex + revenue_subscription
-            
-            # Sum up saving
-            saving_capex = Decimal(str(snapshot.financial_data.get("saving_capex", 0)))
-            saving_subscription = Decimal(str(snapshot.financial_data.get("saving_subscription", 0)))
-            total_saving += saving_capex + saving_subscription
-    
-    exec_summary.actual_revenue_total = total_revenue
-    exec_summary.actual_saving_total = total_saving
-    exec_summary.actual_projects_count = len(report.project_snapshots)
+    exec_summary = SummaryService().recompute(db, report_id)
     
+    bump_change_counter(db, report_id)
     db.commit()
     db.refresh(exec_summary)
     return exec_summary
 
 
+@router.get("/{report_id}/executive-summary/check", response_model=schemas.ReportExecutiveSummaryCheck)
+def check_executive_summary(report_id: int, db: Session = Depends(get_db)):
+    """Compare stored executive summary totals with a full recompute."""
+    from ..services.summary_service import SummaryService
+    
+    report = db.query(Report).filter(Report.id == report_id).first()
+    if not report:
+        raise HTTPException(status_code=404, detail="Report not found")
+    
+    return {"report_id": report_id, **SummaryService().check(db, report_id)}
+
+
+# ============================================================================
+# VERSION HISTORY
+# ============================================================================
+
+@router.get("/{report_id}/versions", response_model=List[schemas.ReportVersionInfo])
+def list_report_versions(report_id: int, db: Session = Depends(get_db)):
+    """List saved versions of a report, newest first."""
+    from ..services.version_service import VersionService
+    
+    if not db.query(Report.id).filter(Report.id == report_id).first():
+        raise HTTPException(status_code=404, detail="Report not found")
+    
+    return VersionService().list_versions(db, report_id)
+
+
+@router.post("/{report_id}/versions", response_model=schemas.ReportVersionInfo, status_code=status.HTTP_201_CREATED)
+def save_report_version(report_id: int, version: schemas.ReportVersionCreate, db: Session = Depends(get_db)):
+    """Save the current state of a report as a new version."""
+    from ..services.version_service import VersionService
+    
+    report = db.query(Report).filter(Report.id == report_id).first()
+    if not report:
+        raise HTTPException(status_code=404, detail="Report not found")
+    
+    version_service = VersionService()
+    db_version = version_service.capture(db, report, notes=version.notes)
+    db.commit()
+    db.refresh(db_version)
+    return version_service.version_info(db_version)
+
+
+@router.get("/{report_id}/versions/{version_number}", response_model=schemas.ReportVersionDetail)
+def get_report_version(report_id: int, version_number: int, db: Session = Depends(get_db)):
+    """Get the full document of a saved version."""
+    from ..services.version_service import VersionService, VersionNotFoundError
+    
+    try:
+        document = VersionService().reconstruct(db, report_id, version_number)
+    except VersionNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    
+    return {"report_id": report_id, "version_number": version_number, "document": document}
+
+
+@router.get("/{report_id}/versions/{from_version}/diff/{to_version}", response_model=schemas.ReportVersionDiff)
+def diff_report_versions(report_id: int, from_version: int, to_version: int, db: Session = Depends(get_db)):
+    """Get the JSON Patch turning one version into another."""
+    from ..services.version_service import VersionService, VersionNotFoundError
+    
+    try:
+        patch = VersionService().diff(db, report_id, from_version, to_version)
+    except VersionNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    
+    return {"report_id": report_id, "from_version": from_version, "to_version": to_version, "patch": patch}
+
+
 # ============================================================================
 # PDF GENERATION
 # ============================================================================
@@ -397,13 +721,18 @@ def generate_pdf_endpoint(report_id: int, request: schemas.GeneratePDFRequest, d
         # Initialize PDF service
         pdf_service = PDFGenerationService()
         
-        # Generate PDF
-        pdf_path = pdf_service.generate_pdf(db, report_id)
+        # Generate PDF (served from cache if the report did not change)
+        pdf_path = pdf_service.get_cached_pdf(db, report_id)
         
-        # Update report status if requested
+        # Update report status if requested (and record the final version)
         if request.finalize:
+            from ..services.version_service import VersionService
+            
             report.status = ReportStatus.FINAL
             report.pdf_generated_at = datetime.utcnow()
+            bump_change_counter(db, report_id)
+            db.flush()
+            VersionService().capture(db, report, notes="Finalized")
             db.commit()
         
         # Return PDF file
@@ -445,62 +774,106 @@ def preview_report_html(report_id: int, db: Session = Depends(get_db)):
         )
 
 
+# ============================================================================
+# JSON EXPORT
+# ============================================================================
+
+@router.get("/{report_id}/export.json")
+def export_report_json(report_id: int, stream: bool = False, db: Session = Depends(get_db)):
+    """Export the full report bundle as JSON (cached for final reports)."""
+    from fastapi.responses import FileResponse, Response, StreamingResponse
+    from ..services.export_service import ReportExportService
+
+    report = db.query(Report).filter(Report.id == report_id).first()
+    if not report:
+        raise HTTPException(status_code=404, detail="Report not found")
+
+    export_service = ReportExportService()
+    filename = f"report_{report_id}.json"
+    headers = {"Content-Disposition": f'inline; filename="{filename}"'}
+
+    try:
+        if report.status == ReportStatus.FINAL:
+            return FileResponse(
+                path=str(export_service.cached_export(db, report)),
+                media_type="application/json",
+                headers=headers
+            )
+
+        if stream:
+            return StreamingResponse(
+                export_service.stream_export(report_id),
+                media_type="application/json",
+                headers=headers
+            )
+
+        return Response(
+            content=export_service.export_bytes(db, report),
+            media_type="application/json",
+            headers=headers
+        )
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"JSON export failed: {str(e)}"
+        )
+
+
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
-def _create_project_snapshot(report_id: int, project: Project, sort_order: int, db: Session) -> ReportProjectSnapshot:
-    """Create a snapshot from a project."""
-    
-    # Gather financial data
-    financial_data = {
-        "revenue_capex": float(sum([r.amount for r in project.revenue_one_time]) if project.revenue_one_time else 0),
-        "revenue_subscription": float(sum([s.amount_per_period for s in project.subscriptions if s.impact_type == "REVENUE"]) if project.subscriptions else 0),
-        "saving_capex": 0,  # TODO: Calculate from one-time saving
-        "saving_subscription": float(sum([s.amount_per_period for s in project.subscriptions if s.impact_type == "SAVING"]) if project.subscriptions else 0),
-        "costs": {
-            "internal": float(sum([c.amount for c in project.costs if c.category == "INTERNAL"]) if project.costs else 0),
-            "vendor": float(sum([c.amount for c in project.costs if c.category == "VENDOR"]) if project.costs else 0),
-            "infrastructure": float(sum([c.amount for c in project.costs if c.category == "INFRASTRUCTURE"]) if project.costs else 0)
-        }
-    }
-    
-    # Gather team data
-    team_data = [{"name": tm.team_member.name, "role": tm.role} for tm in project.team] if project.team else []
-    
-    # Gather stakeholder data
-    stakeholder_data = [{"name": ps.stakeholder.name} for ps in project.stakeholders] if project.stakeholders else []
+def _claim_idempotency_key(db: Session, key: Optional[str], scope: str, payload) -> Optional[IdempotencyClaim]:
+    """Claim an Idempotency-Key for a create request (None without a key)."""
+    if not key:
+        return None
+    try:
+        return IdempotencyService().claim(db, key, scope, payload.model_dump(mode="json"))
+    except IdempotencyConflictError as e:
+        db.rollback()
+        raise HTTPException(status_code=409, detail=str(e))
+
+
+def _replayed(db: Session, model, claim: IdempotencyClaim):
+    """Resource created by the original request of a replayed Idempotency-Key."""
+    resource = db.query(model).filter(model.id == claim.resource_id).first()
+    if not resource:
+        raise HTTPException(status_code=404, detail="Resource created with this Idempotency-Key no longer exists")
+    return resource
+
+
+def _representation(name: str, includes: Optional[List[str]], fields: Optional[List[str]]) -> str:
+    """ETag prefix identifying a (possibly sparse) representation."""
+    if includes is None and fields is None:
+        return name
+    return f"{name}.{cache_key(sorted(includes or []), sorted(fields or []), includes is None, fields is None)[:12]}"
+
+
+def _snapshot_dicts(db: Session, report_id: int, fields: Optional[List[str]]) -> List[dict]:
+    """Snapshots of a report as dicts, fetching only the requested columns."""
+    query = db.query(ReportProjectSnapshot).filter(
+        ReportProjectSnapshot.report_id == report_id
+    ).order_by(ReportProjectSnapshot.sort_order, ReportProjectSnapshot.id)
     
-    # Gather client data
-    client_data = [{"name": pc.client.name} for pc in project.clients] if project.clients else []
+    if fields is None:
+        names = list(SNAPSHOT_FIELDS)
+    else:
+        names = ["id"] + [field for field in fields if field != "id"]
+        query = query.options(
+            load_only(*[getattr(ReportProjectSnapshot, name) for name in names], raiseload=True)
+        )
     
-    # Gather activities
-    activities_data = [
-        {
-            "name": a.name,
-            "status": a.status,
-            "start_date": a.start_date.isoformat() if a.start_date else None,
-            "end_date": a.end_date.isoformat() if a.end_date else None
-        }
-        for a in project.activities
-    ] if project.activities else []
-    
-    return ReportProjectSnapshot(
-        report_id=report_id,
-        project_id=project.id,
-        sort_order=sort_order,
-        name=project.name,
-        project_type=project.project_type,
-        status=project.status,
-        description=project.description,
-        start_date=project.start_date,
-        end_date=project.end_date,
-        financial_data=financial_data,
-        team_data=team_data,
-        stakeholder_data=stakeholder_data,
-        client_data=client_data,
-        activities_data=activities_data
-    )
+    return [{name: getattr(snapshot, name) for name in names} for snapshot in query]
+
+
+def _report_etag(db: Session, report_id: int, representation: str) -> Optional[str]:
+    """Weak ETag of a report representation (None if the report does not exist)."""
+    row = db.query(Report.change_counter, Report.updated_at).filter(Report.id == report_id).first()
+    if not row:
+        return None
+    changed_at = int(row.updated_at.timestamp() * 1000) if row.updated_at else 0
+    return f'W/"{representation}-{report_id}-{row.change_counter}-{changed_at}"'
 
 
 def _sync_snapshot_to_project(snapshot: ReportProjectSnapshot, db: Session):
@@ -520,3 +893,62 @@ def _sync_snapshot_to_project(snapshot: ReportProjectSnapshot, db: Session):
     project.end_date = snapshot.end_date
     
     db.commit()
+
+
+# ============================================================================
+# THUMBNAILS
+# ============================================================================
+
+@router.get("/thumbnails/{digest}.png")
+def get_thumbnail_image(digest: str = Path(..., pattern="^[0-9a-f]{64}$")):
+    """Serve a content-addressed thumbnail (immutable, cached for a year)."""
+    from fastapi.responses import FileResponse
+    from ..services.thumbnail_service import image_path
+
+    path = image_path(digest)
+    if not path:
+        raise HTTPException(status_code=404, detail="Thumbnail not found")
+
+    return FileResponse(
+        path=str(path),
+        media_type="image/png",
+        headers={
+            "Cache-Control": "public, max-age=31536000, immutable",
+            "ETag": f'"{digest}"'
+        }
+    )
+
+
+@router.get("/{report_id}/thumbnail")
+def get_report_thumbnail(
+    report_id: int,
+    background_tasks: BackgroundTasks,
+    page: str = Query("cover", pattern="^(cover|first)$"),
+    db: Session = Depends(get_db)
+):
+    """Redirect to the current thumbnail of a report page, regenerating it in background if stale."""
+    from fastapi.responses import JSONResponse, RedirectResponse
+    from ..services.thumbnail_service import ThumbnailService
+
+    report = db.query(Report).filter(Report.id == report_id).first()
+    if not report:
+        raise HTTPException(status_code=404, detail="Report not found")
+
+    thumbnail_service = ThumbnailService()
+    digest, fresh = thumbnail_service.lookup(db, report, page)
+    if not fresh:
+        background_tasks.add_task(thumbnail_service.regenerate, report_id)
+
+    if digest is None:
+        return JSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content={"status": "pending", "detail": "Thumbnail is being generated"},
+            headers={"Retry-After": "5"}
+        )
+
+    # Serve the previous image while a new one is generated
+    return RedirectResponse(
+        url=f"/api/reports/thumbnails/{digest}.png",
+        status_code=status.HTTP_307_TEMPORARY_REDIRECT,
+        headers={"Cache-Control": "no-cache"}
+    )
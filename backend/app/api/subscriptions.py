@@ -1,12 +1,14 @@
 """Subscriptions and Revenue CRUD API endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from ..database import get_db
 from ..models.subscription import Subscription, SubscriptionTransaction, RevenueOneTime
 from ..models.project import Project
+from ..services.financial_summary_service import refresh_project_financials
+from .pagination import keyset_page
 from ..schemas.subscription import (
     SubscriptionCreate, SubscriptionUpdate, SubscriptionResponse,
     SubscriptionTransactionCreate, SubscriptionTransactionUpdate, SubscriptionTransactionResponse,
@@ -20,17 +22,21 @@ router = APIRouter(prefix="/api", tags=["subscriptions"])
 
 @router.get("/subscriptions", response_model=List[SubscriptionResponse])
 async def list_subscriptions(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
     project_id: int = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=500),
     db: Session = Depends(get_db)
 ):
-    """List all subscriptions."""
+    """List all subscriptions.
+
+    Keyset-paginated by id: pass the X-Next-Cursor response header back as
+    `cursor` while X-Has-More is "true".
+    """
     query = db.query(Subscription)
     if project_id:
         query = query.filter(Subscription.project_id == project_id)
-    subscriptions = query.offset(skip).limit(limit).all()
-    return subscriptions
+    return keyset_page(query, (Subscription.id,), cursor, limit, response)
 
 
 @router.get("/subscriptions/{subscription_id}", response_model=SubscriptionResponse)
@@ -55,6 +61,8 @@ async def create_subscription(
     
     db_subscription = Subscription(**subscription.dict(), project_id=project_id)
     db.add(db_subscription)
+    db.flush()
+    refresh_project_financials(db, [project_id])
     db.commit()
     db.refresh(db_subscription)
     return db_subscription
@@ -74,6 +82,8 @@ async def update_subscription(
     for key, value in subscription.dict(exclude_unset=True).items():
         setattr(db_subscription, key, value)
     
+    db.flush()
+    refresh_project_financials(db, [db_subscription.project_id])
     db.commit()
     db.refresh(db_subscription)
     return db_subscription
@@ -87,6 +97,8 @@ async def delete_subscription(subscription_id: int, db: Session = Depends(get_db
         raise HTTPException(status_code=404, detail="Subscription not found")
     
     db.delete(db_subscription)
+    db.flush()
+    refresh_project_financials(db, [db_subscription.project_id])
     db.commit()
     return None
 
@@ -155,17 +167,21 @@ async def delete_subscription_transaction(transaction_id: int, db: Session = Dep
 
 @router.get("/revenue-one-time", response_model=List[RevenueOneTimeResponse])
 async def list_revenue_one_time(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
     project_id: int = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=500),
     db: Session = Depends(get_db)
 ):
-    """List all one-time revenue entries."""
+    """List all one-time revenue entries.
+
+    Keyset-paginated by id: pass the X-Next-Cursor response header back as
+    `cursor` while X-Has-More is "true".
+    """
     query = db.query(RevenueOneTime)
     if project_id:
         query = query.filter(RevenueOneTime.project_id == project_id)
-    revenue = query.offset(skip).limit(limit).all()
-    return revenue
+    return keyset_page(query, (RevenueOneTime.id,), cursor, limit, response)
 
 
 @router.get("/revenue-one-time/{revenue_id}", response_model=RevenueOneTimeResponse)
@@ -190,6 +206,8 @@ async def create_revenue_one_time(
     
     db_revenue = RevenueOneTime(**revenue.dict(), project_id=project_id)
     db.add(db_revenue)
+    db.flush()
+    refresh_project_financials(db, [project_id])
     db.commit()
     db.refresh(db_revenue)
     return db_revenue
@@ -209,6 +227,8 @@ async def update_revenue_one_time(
     for key, value in revenue.dict(exclude_unset=True).items():
         setattr(db_revenue, key, value)
     
+    db.flush()
+    refresh_project_financials(db, [db_revenue.project_id])
     db.commit()
     db.refresh(db_revenue)
     return db_revenue
@@ -222,5 +242,7 @@ async def delete_revenue_one_time(revenue_id: int, db: Session = Depends(get_db)
         raise HTTPException(status_code=404, detail="Revenue entry not found")
     
     db.delete(db_revenue)
+    db.flush()
+    refresh_project_financials(db, [db_revenue.project_id])
     db.commit()
     return None
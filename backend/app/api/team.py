@@ -1,8 +1,8 @@
 """Team and Stakeholders CRUD API endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from ..database import get_db
 from ..models.project import TeamMember, Stakeholder
@@ -10,6 +10,7 @@ from ..schemas.team import (
     TeamMemberCreate, TeamMemberUpdate, TeamMemberResponse,
     StakeholderCreate, StakeholderUpdate, StakeholderResponse
 )
+from .pagination import keyset_page
 
 router = APIRouter(prefix="/api", tags=["team"])
 
@@ -18,13 +19,17 @@ router = APIRouter(prefix="/api", tags=["team"])
 
 @router.get("/team-members", response_model=List[TeamMemberResponse])
 async def list_team_members(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=500),
     db: Session = Depends(get_db)
 ):
-    """List all team members."""
-    team_members = db.query(TeamMember).offset(skip).limit(limit).all()
-    return team_members
+    """List all team members.
+
+    Keyset-paginated by id: pass the X-Next-Cursor response header back as
+    `cursor` while X-Has-More is "true".
+    """
+    return keyset_page(db.query(TeamMember), (TeamMember.id,), cursor, limit, response)
 
 
 @router.get("/team-members/{member_id}", response_model=TeamMemberResponse)
@@ -81,13 +86,17 @@ async def delete_team_member(member_id: int, db: Session = Depends(get_db)):
 
 @router.get("/stakeholders", response_model=List[StakeholderResponse])
 async def list_stakeholders(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=500),
     db: Session = Depends(get_db)
 ):
-    """List all stakeholders."""
-    stakeholders = db.query(Stakeholder).offset(skip).limit(limit).all()
-    return stakeholders
+    """List all stakeholders.
+
+    Keyset-paginated by id: pass the X-Next-Cursor response header back as
+    `cursor` while X-Has-More is "true".
+    """
+    return keyset_page(db.query(Stakeholder), (Stakeholder.id,), cursor, limit, response)
 
 
 @router.get("/stakeholders/{stakeholder_id}", response_model=StakeholderResponse)
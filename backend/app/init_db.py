@@ -5,9 +5,12 @@ from .database import engine, Base, SessionLocal
 
 # Import all models so they're registered with Base
 from .models.user import User, MagicLink, UserSession
-from .models.project import Project, TeamMember, Client
+from .models.project import Project, TeamMember, Client, ProjectFinancialSummary
 from .models.subscription import Subscription, RevenueOneTime, SubscriptionTransaction
-from .models.report import ReportVersion
+from .models.report import ReportVersion, ReportArchive
+from .models.idempotency import IdempotencyKey
+from .models.pipeline import PipelineCheckpoint
+from .services.financial_summary_service import backfill_project_financials
 
 
 def init_database():
@@ -25,6 +28,16 @@ def init_database():
         Base.metadata.create_all(bind=engine)
         print("✅ Tables created successfully")
 
+        # Backfill precomputed financial totals of projects that have none
+        print("💰 Backfilling project financial summaries...")
+        db = SessionLocal()
+        try:
+            created = backfill_project_financials(db)
+            db.commit()
+        finally:
+            db.close()
+        print(f"✅ Project financial summaries up to date ({created} created)")
+
         # Display summary
         db = SessionLocal()
         try:
@@ -51,6 +51,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Next-Cursor", "X-Has-More"],
 )
 
 # Mount static files
@@ -210,7 +211,7 @@ async def stakeholders_page(request: Request, session_token: str = Cookie(None))
 
 
 # Import and include API routers
-from .api import auth, projects, clients, team, subscriptions, reports
+from .api import auth, projects, clients, team, subscriptions, reports, bootstrap
 
 app.include_router(auth.router)
 app.include_router(auth.public_router)  # Public routes without /api/ prefix
@@ -219,6 +220,7 @@ app.include_router(clients.router)
 app.include_router(team.router)
 app.include_router(subscriptions.router)
 app.include_router(reports.router)
+app.include_router(bootstrap.router)
 
 
 if __name__ == "__main__":
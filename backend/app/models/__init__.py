@@ -10,7 +10,8 @@ from .project import (
     TeamMember,
     ProjectTeam,
     ProjectActivity,
-    ProjectCost
+    ProjectCost,
+    ProjectFinancialSummary
 )
 from .subscription import (
     RevenueOneTime,
@@ -22,9 +23,12 @@ from .report import (
     ReportProjectSnapshot,
     ReportExecutiveSummary,
     ReportVersion,
+    ReportArchive,
     ReportTemplate,
     ReportStatus
 )
+from .idempotency import IdempotencyKey
+from .pipeline import PipelineCheckpoint
 
 __all__ = [
     "User",
@@ -39,6 +43,7 @@ __all__ = [
     "ProjectTeam",
     "ProjectActivity",
     "ProjectCost",
+    "ProjectFinancialSummary",
     "RevenueOneTime",
     "Subscription",
     "SubscriptionTransaction",
@@ -46,6 +51,9 @@ __all__ = [
     "ReportProjectSnapshot",
     "ReportExecutiveSummary",
     "ReportVersion",
+    "ReportArchive",
     "ReportTemplate",
     "ReportStatus",
+    "IdempotencyKey",
+    "PipelineCheckpoint",
 ]
@@ -0,0 +1,22 @@
+"""Idempotency key model."""
+
+from sqlalchemy import Column, Integer, String, DateTime, UniqueConstraint, func
+from ..database import Base
+
+
+class IdempotencyKey(Base):
+    """Idempotency-Key of a create request and the resource it produced."""
+    
+    __tablename__ = "idempotency_keys"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    key = Column(String(255), nullable=False)
+    scope = Column(String(100), nullable=False)  # Endpoint (and parent resource) the key applies to
+    request_hash = Column(String(64), nullable=False)  # Detects a key reused with a different body
+    resource_id = Column(Integer)  # ID of the created report / snapshot
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    
+    __table_args__ = (
+        UniqueConstraint("key", "scope", name="uq_idempotency_keys_key_scope"),
+    )
@@ -0,0 +1,23 @@
+"""Pipeline checkpoint model."""
+
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, UniqueConstraint, func
+from ..database import Base
+
+
+class PipelineCheckpoint(Base):
+    """Outcome of one stage of a pipeline run for one report."""
+
+    __tablename__ = "pipeline_checkpoints"
+
+    id = Column(Integer, primary_key=True, index=True)
+    run_key = Column(String(100), nullable=False)  # "month_close:2025-11"
+    report_id = Column(Integer, ForeignKey("reports.id", ondelete="CASCADE"), nullable=False)
+    stage = Column(String(50), nullable=False)
+    status = Column(String(20), nullable=False)  # completed / failed
+    error = Column(Text)
+    attempts = Column(Integer, nullable=False, default=1, server_default="1")
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        UniqueConstraint("run_key", "report_id", "stage", name="uq_pipeline_checkpoints_run_report_stage"),
+    )
@@ -56,13 +56,14 @@ class Project(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
     # Relationships
-    stakeholders = relationship("ProjectStakeholder", back_populates="project", cascade="all, delete-orphan")
-    clients = relationship("ProjectClient", back_populates="project", cascade="all, delete-orphan")
-    team = relationship("ProjectTeam", back_populates="project", cascade="all, delete-orphan")
-    activities = relationship("ProjectActivity", back_populates="project", cascade="all, delete-orphan")
-    costs = relationship("ProjectCost", back_populates="project", cascade="all, delete-orphan")
-    revenue_one_time = relationship("RevenueOneTime", back_populates="project", cascade="all, delete-orphan")
-    subscriptions = relationship("Subscription", back_populates="project", cascade="all, delete-orphan")
+    stakeholders = relationship("ProjectStakeholder", back_populates="project", cascade="all, delete-orphan", passive_deletes=True)
+    clients = relationship("ProjectClient", back_populates="project", cascade="all, delete-orphan", passive_deletes=True)
+    team = relationship("ProjectTeam", back_populates="project", cascade="all, delete-orphan", passive_deletes=True)
+    activities = relationship("ProjectActivity", back_populates="project", cascade="all, delete-orphan", passive_deletes=True)
+    costs = relationship("ProjectCost", back_populates="project", cascade="all, delete-orphan", passive_deletes=True)
+    revenue_one_time = relationship("RevenueOneTime", back_populates="project", cascade="all, delete-orphan", passive_deletes=True)
+    subscriptions = relationship("Subscription", back_populates="project", cascade="all, delete-orphan", passive_deletes=True)
+    financial_summary = relationship("ProjectFinancialSummary", back_populates="project", uselist=False, passive_deletes=True)
 
 
 class Stakeholder(Base):
@@ -74,6 +75,7 @@ class Stakeholder(Base):
     name = Column(String(255), unique=True, nullable=False)
     description = Column(Text)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
     # Relationships
     projects = relationship("ProjectStakeholder", back_populates="stakeholder")
@@ -104,6 +106,7 @@ class Client(Base):
     name = Column(String(255), unique=True, nullable=False)
     description = Column(Text)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
     # Relationships
     projects = relationship("ProjectClient", back_populates="client")
@@ -134,6 +137,7 @@ class TeamMember(Base):
     email = Column(String(255), unique=True)
     role = Column(String(255))  # e.g., "PM", "Developer", "Architect"
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
     # Relationships
     projects = relationship("ProjectTeam", back_populates="team_member")
@@ -189,3 +193,22 @@ class ProjectCost(Base):
     
     # Relationships
     project = relationship("Project", back_populates="costs")
+
+
+class ProjectFinancialSummary(Base):
+    """Per-project financial totals, kept current on every revenue, subscription and cost write."""
+    
+    __tablename__ = "project_financial_summary"
+    
+    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True)
+    revenue_capex = Column(Numeric(15, 2), nullable=False, default=0, server_default="0")  # One-time revenue
+    revenue_subscription = Column(Numeric(15, 2), nullable=False, default=0, server_default="0")
+    saving_subscription = Column(Numeric(15, 2), nullable=False, default=0, server_default="0")
+    subscriptions_total = Column(Numeric(15, 2), nullable=False, default=0, server_default="0")  # All subscriptions (ARR)
+    cost_internal = Column(Numeric(15, 2), nullable=False, default=0, server_default="0")
+    cost_vendor = Column(Numeric(15, 2), nullable=False, default=0, server_default="0")
+    cost_infrastructure = Column(Numeric(15, 2), nullable=False, default=0, server_default="0")
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    
+    # Relationships
+    project = relationship("Project", back_populates="financial_summary")
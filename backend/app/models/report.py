@@ -1,6 +1,6 @@
 """Report models."""
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Numeric, Date, func, Boolean
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Numeric, Date, func, Boolean, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import JSONB
 from ..database import Base
@@ -33,15 +33,20 @@ class Report(Base):
     
     # Metadata
     description = Column(Text)
+    change_counter = Column(Integer, nullable=False, default=0, server_default="0")  # Bumped on every edit (ETags)
     created_by = Column(Integer, ForeignKey("users.id"))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
     # Relationships
-    project_snapshots = relationship("ReportProjectSnapshot", back_populates="report", cascade="all, delete-orphan")
-    executive_summary = relationship("ReportExecutiveSummary", back_populates="report", uselist=False, cascade="all, delete-orphan")
-    versions = relationship("ReportVersion", back_populates="report", cascade="all, delete-orphan")
+    project_snapshots = relationship("ReportProjectSnapshot", back_populates="report", cascade="all, delete-orphan", passive_deletes=True)
+    executive_summary = relationship("ReportExecutiveSummary", back_populates="report", uselist=False, cascade="all, delete-orphan", passive_deletes=True)
+    versions = relationship("ReportVersion", back_populates="report", cascade="all, delete-orphan", passive_deletes=True)
     creator = relationship("User", foreign_keys=[created_by])
+    
+    __table_args__ = (
+        Index("ix_reports_created_at_id", "created_at", "id"),  # List keyset pagination
+    )
 
 
 class ReportProjectSnapshot(Base):
@@ -50,7 +55,7 @@ class ReportProjectSnapshot(Base):
     __tablename__ = "report_project_snapshots"
     
     id = Column(Integer, primary_key=True, index=True)
-    report_id = Column(Integer, ForeignKey("reports.id", ondelete="CASCADE"), nullable=False)
+    report_id = Column(Integer, ForeignKey("reports.id", ondelete="CASCADE"), nullable=False, index=True)
     project_id = Column(Integer, ForeignKey("projects.id", ondelete="SET NULL"))  # Keep snapshot even if project deleted
     sort_order = Column(Integer, default=0)
     
@@ -128,6 +133,24 @@ class ReportVersion(Base):
     # Relationships
     report = relationship("Report", back_populates="versions")
     created_by_user = relationship("User")
+    
+    __table_args__ = (
+        Index("ix_report_versions_report_id_version_number", "report_id", "version_number", unique=True),
+    )
+
+
+class ReportArchive(Base):
+    """Archived copy of a deleted report (report, summary, snapshots and versions as JSON)."""
+
+    __tablename__ = "report_archives"
+
+    id = Column(Integer, primary_key=True, index=True)
+    report_id = Column(Integer, nullable=False, index=True)  # ID of the deleted report
+    name = Column(String(255), nullable=False)
+    period_start = Column(Date, nullable=False)
+    period_end = Column(Date, nullable=False)
+    data = Column(JSONB, nullable=False)  # {"report": ..., "executive_summary": ..., "snapshots": [...], "versions": [...]}
+    archived_at = Column(DateTime(timezone=True), server_default=func.now())
 
 
 class ReportTemplate(Base):
@@ -1,6 +1,6 @@
 """Subscription and revenue models."""
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Numeric, Date, Boolean, func, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Numeric, Date, Boolean, Index, func, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 from ..database import Base
 import enum
@@ -29,6 +29,10 @@ class RevenueOneTime(Base):
     
     # Relationships
     project = relationship("Project", back_populates="revenue_one_time")
+    
+    __table_args__ = (
+        Index("ix_revenue_one_time_project_id_id", "project_id", "id"),  # Per-project list keyset pagination
+    )
 
 
 class Subscription(Base):
@@ -48,7 +52,11 @@ class Subscription(Base):
     
     # Relationships
     project = relationship("Project", back_populates="subscriptions")
-    transactions = relationship("SubscriptionTransaction", back_populates="subscription", cascade="all, delete-orphan")
+    transactions = relationship("SubscriptionTransaction", back_populates="subscription", cascade="all, delete-orphan", passive_deletes=True)
+    
+    __table_args__ = (
+        Index("ix_subscriptions_project_id_id", "project_id", "id"),  # Per-project list keyset pagination
+    )
 
 
 class SubscriptionTransaction(Base):
@@ -0,0 +1,60 @@
+"""Run (or resume) the month-close pipeline for a period.
+
+Usage:
+    python -m app.month_close YYYY-MM [--report-id ID ...] [--template-id ID] [--no-finalize]
+
+Stages are checkpointed per report; rerunning the same period after a
+failure or crash only runs the stages that did not complete.
+"""
+import argparse
+import sys
+
+from .database import SessionLocal
+from .pregenerate import parse_period
+from .services.month_close_service import COMPLETED, FAILED, MonthCloseNotFoundError, MonthClosePipeline
+
+ICONS = {COMPLETED: "✅", FAILED: "❌"}
+
+
+def month_close(period, report_ids=None, template_id=None, finalize=True):
+    """Run the pipeline, printing one line per report and stage."""
+    period_start, period_end = period
+    print(f"📅 Closing {period_start:%Y-%m}...")
+
+    pipeline = MonthClosePipeline(finalize=finalize)
+    db = SessionLocal()
+    try:
+        reports = pipeline.prepare(db, period_start, period_end, report_ids=report_ids, template_id=template_id)
+        db.commit()
+    except (MonthCloseNotFoundError, ValueError) as e:
+        print(f"❌ {e}")
+        return False
+    finally:
+        db.close()
+
+    failed = 0
+    for event in pipeline.run(period_start, reports):
+        icon = ICONS.get(event["status"], "⏭️ ")
+        line = f"{icon} Report {event['report_id']}: {event['stage']} {event['status']}"
+        if event["error"]:
+            line += f" ({event['error']})"
+            failed += 1
+        print(line)
+
+    if failed:
+        print(f"⚠️  {failed} stages failed, rerun to resume")
+        return False
+    print("✅ Month close complete")
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the month-close pipeline")
+    parser.add_argument("period", type=parse_period, help="Period to close (YYYY-MM)")
+    parser.add_argument("--report-id", type=int, action="append", dest="report_ids", help="Only this report (repeatable)")
+    parser.add_argument("--template-id", type=int, help="Template for the draft created if the period has none")
+    parser.add_argument("--no-finalize", action="store_true", help="Prepare the reports without finalizing them")
+    args = parser.parse_args()
+
+    ok = month_close(args.period, report_ids=args.report_ids, template_id=args.template_id, finalize=not args.no_finalize)
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,75 @@
+"""Pre-generate next month's draft report (run off-peak from cron).
+
+Usage:
+    python -m app.pregenerate [--period YYYY-MM] [--template-id ID] [--no-pdf]
+
+Example crontab entry (02:30 on the 28th, drafts ready before month start):
+    30 2 28 * * cd /app/backend && python -m app.pregenerate
+"""
+import argparse
+import sys
+from datetime import datetime
+
+from .database import SessionLocal
+from .models.report import ReportStatus
+from .services.pregeneration_service import DraftPregenerationService, month_period, next_period
+
+
+def parse_period(value: str):
+    """Parse YYYY-MM into (period_start, period_end)."""
+    try:
+        month = datetime.strptime(value, "%Y-%m")
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid period '{value}', expected YYYY-MM")
+    return month_period(month.year, month.month)
+
+
+def pregenerate(period=None, template_id=None, warm_pdf=True):
+    """Create the draft report, its snapshots and summary, then warm the PDF cache."""
+    period_start, period_end = period or next_period()
+    print(f"🗓️  Pre-generating draft report for {period_start} - {period_end}...")
+
+    db = SessionLocal()
+    try:
+        service = DraftPregenerationService()
+        report = service.create_draft(db, period_start, period_end, template_id)
+        db.commit()
+
+        if report is None:
+            # Already created by an earlier run; its PDF may still need warming
+            report = service.existing_report(db, period_start, period_end)
+            if report.status != ReportStatus.DRAFT:
+                print(f"ℹ️  Report {report.id} for this period is {report.status}, nothing to do")
+                return True
+            print(f"ℹ️  Draft report {report.id} already exists ({report.name})")
+        else:
+            print(f"✅ Draft report {report.id} created ({report.name})")
+
+        if warm_pdf:
+            from .services.pdf_service import PDFGenerationService
+
+            print("📄 Rendering PDF...")
+            PDFGenerationService().get_cached_pdf(db, report.id)
+            print("✅ PDF cache warmed")
+
+        return True
+
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Pre-generation failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pre-generate next month's draft report")
+    parser.add_argument("--period", type=parse_period, help="Period to generate (YYYY-MM, default: next month)")
+    parser.add_argument("--template-id", type=int, help="Report template (default: the default template)")
+    parser.add_argument("--no-pdf", action="store_true", help="Skip warming the PDF cache")
+    args = parser.parse_args()
+
+    ok = pregenerate(period=args.period, template_id=args.template_id, warm_pdf=not args.no_pdf)
+    sys.exit(0 if ok else 1)
@@ -1,10 +1,15 @@
 """Pydantic schemas for Project models."""
 
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 from datetime import date, datetime
+from decimal import Decimal
 from enum import Enum
 
+from .client import ClientResponse
+from .subscription import RevenueOneTimeResponse, SubscriptionResponse
+from .team import StakeholderResponse, TeamMemberResponse
+
 
 class ProjectType(str, Enum):
     """Project type enum."""
@@ -77,6 +82,25 @@ class ProjectResponse(ProjectBase):
         from_attributes = True
 
 
+class ProjectFinancialSummaryResponse(BaseModel):
+    """Schema for a project's precomputed financial totals."""
+    revenue_capex: Decimal = Decimal("0")
+    revenue_subscription: Decimal = Decimal("0")
+    saving_subscription: Decimal = Decimal("0")
+    subscriptions_total: Decimal = Decimal("0")
+    cost_internal: Decimal = Decimal("0")
+    cost_vendor: Decimal = Decimal("0")
+    cost_infrastructure: Decimal = Decimal("0")
+
+    class Config:
+        from_attributes = True
+
+
+class ProjectListResponse(ProjectResponse):
+    """Schema for a project in the project list (with financial totals)."""
+    financial_summary: Optional[ProjectFinancialSummaryResponse] = None
+
+
 # ==================== PROJECT ACTIVITY ====================
 
 class ProjectActivityBase(BaseModel):
@@ -144,3 +168,49 @@ class ProjectCostResponse(ProjectCostBase):
 
     class Config:
         from_attributes = True
+
+
+# ==================== PROJECT DETAIL ====================
+
+class ProjectTeamResponse(BaseModel):
+    """Schema for a team member assigned to a project."""
+    id: int
+    team_member_id: int
+    role_in_project: Optional[str] = None
+    team_member: TeamMemberResponse
+
+    class Config:
+        from_attributes = True
+
+
+class ProjectClientResponse(BaseModel):
+    """Schema for a client linked to a project."""
+    id: int
+    client_id: int
+    client: ClientResponse
+
+    class Config:
+        from_attributes = True
+
+
+class ProjectStakeholderResponse(BaseModel):
+    """Schema for a stakeholder linked to a project."""
+    id: int
+    stakeholder_id: int
+    role: Optional[str] = None
+    stakeholder: StakeholderResponse
+
+    class Config:
+        from_attributes = True
+
+
+class ProjectDetailResponse(ProjectResponse):
+    """Schema for a project with the children requested via ?include= (others are omitted)."""
+    financial_summary: Optional[ProjectFinancialSummaryResponse] = None
+    activities: Optional[List[ProjectActivityResponse]] = None
+    costs: Optional[List[ProjectCostResponse]] = None
+    subscriptions: Optional[List[SubscriptionResponse]] = None
+    revenue: Optional[List[RevenueOneTimeResponse]] = None
+    team: Optional[List[ProjectTeamResponse]] = None
+    clients: Optional[List[ProjectClientResponse]] = None
+    stakeholders: Optional[List[ProjectStakeholderResponse]] = None
@@ -75,6 +75,27 @@ class ReportProjectSnapshotUpdate(BaseModel):
     custom_fields: Optional[Dict[str, Any]] = None
 
 
+class ReportProjectSnapshotBulkItem(ReportProjectSnapshotUpdate):
+    id: int
+
+
+class ReportProjectSnapshotBulkUpdate(BaseModel):
+    snapshots: List[ReportProjectSnapshotBulkItem]
+    sync_projects: bool = True  # Copy basic fields back to the linked projects
+
+
+class ReportSnapshotRefresh(BaseModel):
+    snapshot_ids: Optional[List[int]] = None  # None = every snapshot of the report
+    fields: Optional[List[str]] = None  # None = every field derived from the project
+    policy: str = Field(default="overwrite", pattern="^(overwrite|fill_missing)$")
+
+
+class ReportSnapshotRefreshResult(BaseModel):
+    updated_ids: List[int]
+    unchanged_count: int
+    orphaned_snapshot_ids: List[int]  # Snapshots with no source project (left untouched)
+
+
 class ReportProjectSnapshot(ReportProjectSnapshotBase):
     id: int
     report_id: int
@@ -116,6 +137,13 @@ class ReportExecutiveSummary(ReportExecutiveSummaryBase):
         from_attributes = True
 
 
+class ReportExecutiveSummaryCheck(BaseModel):
+    report_id: int
+    consistent: bool
+    stored: Dict[str, Any]
+    computed: Dict[str, Any]
+
+
 # Report Schemas
 class ReportBase(BaseModel):
     name: str
@@ -180,6 +208,71 @@ class ReportCopy(BaseModel):
     period_end: date
 
 
+class ReportArchiveRequest(BaseModel):
+    """Reports to archive (filters are combined)."""
+    report_ids: Optional[List[int]] = None
+    before: Optional[date] = None  # period_end earlier than this date
+    status: Optional[str] = None
+
+
+class ReportArchiveResult(BaseModel):
+    archived_count: int
+    report_ids: List[int]
+
+
+class MonthCloseRequest(BaseModel):
+    """Run (or resume) the month-close pipeline for a period."""
+    period: str = Field(..., pattern=r"^\d{4}-(0[1-9]|1[0-2])$")  # YYYY-MM
+    report_ids: Optional[List[int]] = None  # Default: every report of the period
+    template_id: Optional[int] = None  # For the draft created when the period has none
+    finalize: bool = True
+
+
+# Report Diff Schemas
+class ReportDiffProject(BaseModel):
+    project_id: Optional[int] = None
+    name: Optional[str] = None
+    fields: Dict[str, Dict[str, Any]] = Field(default_factory=dict)  # field -> {from, to}
+    financial: Dict[str, Dict[str, float]] = Field(default_factory=dict)  # figure -> {from, to, delta}
+
+
+class ReportDiff(BaseModel):
+    from_report: Dict[str, Any]
+    to_report: Dict[str, Any]
+    added: List[ReportDiffProject]
+    removed: List[ReportDiffProject]
+    changed: List[ReportDiffProject]
+    unchanged_count: int
+    totals: Dict[str, Dict[str, float]]  # executive summary -> {from, to, delta}
+
+
+# Version History Schemas
+class ReportVersionCreate(BaseModel):
+    notes: Optional[str] = None
+
+
+class ReportVersionInfo(BaseModel):
+    id: int
+    version_number: int
+    kind: str  # "base" (full document) or "delta" (JSON Patch)
+    created_by: Optional[int] = None
+    created_at: datetime
+    notes: Optional[str] = None
+
+
+class ReportVersionDetail(BaseModel):
+    report_id: int
+    version_number: int
+    document: Dict[str, Any]
+
+
+class ReportVersionDiff(BaseModel):
+    report_id: int
+    from_version: int
+    to_version: int
+    patch: List[Dict[str, Any]]  # RFC 6902 operations
+
+
 class GeneratePDFRequest(BaseModel):
     """Request to generate PDF for a report."""
     finalize: bool = False  # Set status to "final" after generation
@@ -0,0 +1,124 @@
+"""
+Report Archive Service for ReportForge
+
+Moves old reports out of the working tables: each report is copied into
+report_archives as one JSON document (report row, executive summary,
+snapshots and version history) and then deleted, letting the ON DELETE
+CASCADE foreign keys remove its snapshots, summary and versions.
+
+The copy and the delete run as a single statement (a data-modifying CTE).
+Both parts see the same snapshot of the database, so the archived document
+is exactly what gets deleted, and nothing is loaded into Python. Once the
+deletion is committed, discard_artifacts() removes the cached PDFs, JSON
+exports and thumbnails of the archived reports.
+"""
+
+from datetime import date
+from typing import Iterable, List, Optional
+import logging
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.orm import Session
+
+from app.models.report import Report, ReportProjectSnapshot, ReportExecutiveSummary, ReportArchive, ReportVersion
+
+logger = logging.getLogger(__name__)
+
+
+class ReportArchiveService:
+    """Bulk archive-and-delete of reports"""
+
+    def archive(
+        self,
+        db: Session,
+        report_ids: Optional[List[int]] = None,
+        before: Optional[date] = None,
+        status: Optional[str] = None
+    ) -> List[int]:
+        """
+        Archive and delete reports (does not commit)
+
+        Args:
+            db: Database session
+            report_ids: Only these reports
+            before: Only reports whose period ended before this date
+            status: Only reports with this status (e.g. 'final')
+
+        Returns:
+            IDs of the archived reports
+        """
+        reports = Report.__table__
+
+        conditions = []
+        if report_ids is not None:
+            conditions.append(reports.c.id.in_(report_ids))
+        if before is not None:
+            conditions.append(reports.c.period_end < before)
+        if status is not None:
+            conditions.append(reports.c.status == status)
+        if not conditions:
+            raise ValueError("At least one of report_ids, before or status is required")
+
+        summaries = ReportExecutiveSummary.__table__
+        snapshots = ReportProjectSnapshot.__table__
+        versions = ReportVersion.__table__
+
+        summary_json = select(func.to_jsonb(summaries.table_valued())).where(
+            summaries.c.report_id == reports.c.id
+        ).scalar_subquery()
+        snapshots_json = select(
+            func.coalesce(
+                func.jsonb_agg(aggregate_order_by(
+                    func.to_jsonb(snapshots.table_valued()), snapshots.c.sort_order, snapshots.c.id
+                )),
+                func.jsonb_build_array()
+            )
+        ).where(snapshots.c.report_id == reports.c.id).scalar_subquery()
+        versions_json = select(
+            func.coalesce(
+                func.jsonb_agg(aggregate_order_by(
+                    func.to_jsonb(versions.table_valued()), versions.c.version_number
+                )),
+                func.jsonb_build_array()
+            )
+        ).where(versions.c.report_id == reports.c.id).scalar_subquery()
+
+        source = select(
+            reports.c.id,
+            reports.c.name,
+            reports.c.period_start,
+            reports.c.period_end,
+            func.jsonb_build_object(
+                'report', func.to_jsonb(reports.table_valued()),
+                'executive_summary', summary_json,
+                'snapshots', snapshots_json,
+                'versions', versions_json
+            )
+        ).where(*conditions)
+
+        archives = ReportArchive.__table__
+        archived = insert(archives).from_select(
+            ['report_id', 'name', 'period_start', 'period_end', 'data'], source
+        ).returning(archives.c.report_id).cte('archived')
+
+        archived_ids = db.execute(
+            delete(reports).where(reports.c.id.in_(select(archived.c.report_id))).returning(reports.c.id)
+        ).scalars().all()
+
+        logger.info(f"Archived {len(archived_ids)} reports")
+        return sorted(archived_ids)
+
+    def discard_artifacts(self, report_ids: Iterable[int]) -> None:
+        """Delete the cached PDFs, exports and thumbnails of archived reports (call after commit)"""
+        from app.services.export_service import ReportExportService
+        from app.services.pdf_service import PDFGenerationService
+        from app.services.thumbnail_service import ThumbnailService
+
+        pdf_cache = PDFGenerationService().pdf_cache
+        export_cache = ReportExportService().cache
+        thumbnails = ThumbnailService()
+        for report_id in report_ids:
+            pdf_cache.discard(f"report_{report_id}_")
+            export_cache.discard(f"report_{report_id}_")
+            thumbnails.discard(report_id)
@@ -0,0 +1,203 @@
+"""
+Cache helpers for generated report artifacts
+
+Artifacts (JSON exports, PDFs, images) are stored on disk under a namespace
+directory and addressed by a hash of the inputs that produced them, so a
+changed report simply misses the cache instead of needing invalidation.
+Small derived values (layouts, diffs) live in an in-process LRU instead.
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Hashable, List, Optional, Sequence
+import logging
+
+import orjson
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+
+from app.models.project import (
+    Client, Project, ProjectClient, ProjectFinancialSummary, ProjectTeam, Stakeholder, TeamMember
+)
+from app.models.report import Report, ReportProjectSnapshot, ReportExecutiveSummary
+from app.models.subscription import RevenueOneTime, Subscription
+
+logger = logging.getLogger(__name__)
+
+CACHE_ROOT = Path(os.getenv(
+    "REPORTFORGE_CACHE_DIR",
+    str(Path(__file__).parent.parent.parent / "reports" / "cache")
+))
+
+
+def cache_key(*parts: Any) -> str:
+    """Build a stable hex digest from arbitrary JSON-serializable parts"""
+    payload = orjson.dumps(parts, default=str, option=orjson.OPT_SORT_KEYS)
+    return hashlib.sha256(payload).hexdigest()
+
+
+class FileCache:
+    """On-disk key/value store for generated artifacts"""
+
+    def __init__(self, namespace: str, suffix: str = "", root: Optional[Path] = None):
+        """
+        Initialize file cache
+
+        Args:
+            namespace: Sub-directory grouping one kind of artifact
+            suffix: File extension appended to every key (e.g. '.json')
+            root: Cache root directory (defaults to CACHE_ROOT)
+        """
+        self.directory = (root or CACHE_ROOT) / namespace
+        self.suffix = suffix
+
+    def path_for(self, key: str) -> Path:
+        """Return the file path for a key (whether or not it exists)"""
+        return self.directory / f"{key}{self.suffix}"
+
+    def get(self, key: str) -> Optional[Path]:
+        """Return the cached file path for a key, or None on a miss"""
+        path = self.path_for(key)
+        return path if path.exists() else None
+
+    def temp_path_for(self, key: str) -> Path:
+        """Return a private temporary path next to the final file for key"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.path_for(key)
+        return path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+    def put(self, key: str, data: bytes) -> Path:
+        """
+        Store data under a key
+
+        The file is written to a temporary name and renamed into place, so
+        concurrent readers never observe a partially written artifact.
+        """
+        tmp_path = self.temp_path_for(key)
+        tmp_path.write_bytes(data)
+        return self.put_file(key, tmp_path)
+
+    def put_file(self, key: str, source: Path) -> Path:
+        """Move a file written at temp_path_for(key) into the cache"""
+        path = self.path_for(key)
+        os.replace(source, path)
+        logger.debug(f"Cached {path}")
+        return path
+
+    def discard(self, key_prefix: str) -> int:
+        """Delete every cached file whose key starts with key_prefix; returns the number deleted"""
+        removed = 0
+        for path in self.directory.glob(f"{key_prefix}*{self.suffix}"):
+            path.unlink(missing_ok=True)
+            removed += 1
+        return removed
+
+
+class LRUCache:
+    """Thread-safe in-process LRU map"""
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the value for key (marking it recently used), or None"""
+        with self._lock:
+            if key not in self._data:
+                return None
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if full"""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """Return the cached value for key, computing and storing it on a miss"""
+        value = self.get(key)
+        if value is None:
+            value = factory()
+            self.put(key, value)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+def bump_change_counter(db: Session, report_id: int) -> None:
+    """
+    Mark a report as changed (does not commit)
+
+    Every mutation of a report or of its snapshots and summary calls this in
+    its own transaction, so (id, change_counter, updated_at) identifies a
+    version of the report with a single indexed lookup.
+    """
+    db.execute(
+        update(Report).where(Report.id == report_id).values(change_counter=Report.change_counter + 1)
+    )
+
+
+# Live tables rendered into every report besides its own rows (subscription
+# and one-time revenue lists, team and stakeholder pages, portfolio totals).
+# Subscription and revenue rows have no updated_at, but every write to them
+# refreshes their project's financial summary row, whose updated_at changes.
+RENDERED_GLOBAL_MODELS = (
+    Subscription, RevenueOneTime, ProjectFinancialSummary, Project, ProjectClient, Client,
+    TeamMember, ProjectTeam, Stakeholder
+)
+
+
+def table_markers(db: Session, models: Sequence) -> List[Any]:
+    """
+    Row count and last change time of each model's table, in one query
+
+    Any insert, delete or (for tables with updated_at) update changes the
+    markers, so they can version data that is read as a whole.
+    """
+    columns = []
+    for model in models:
+        timestamps = [getattr(model, name) for name in ('updated_at', 'created_at') if hasattr(model, name)]
+        changed_at = func.coalesce(*timestamps) if len(timestamps) > 1 else timestamps[0]
+        columns.append(select(func.count()).select_from(model).scalar_subquery())
+        columns.append(select(func.max(changed_at)).scalar_subquery())
+    return list(db.execute(select(*columns)).one())
+
+
+def report_fingerprint(db: Session, report: Report) -> str:
+    """
+    Compute a content fingerprint for a report
+
+    Combines the report row with cheap aggregates over its snapshots and
+    executive summary, so any edit to the report produces a new value
+    without loading the JSONB payloads, plus table_markers() of the global
+    data the report renders.
+    """
+    snapshot_count, snapshot_changed_at = db.query(
+        func.count(ReportProjectSnapshot.id),
+        func.max(func.coalesce(ReportProjectSnapshot.updated_at, ReportProjectSnapshot.created_at))
+    ).filter(ReportProjectSnapshot.report_id == report.id).one()
+
+    summary_changed_at = db.query(
+        func.coalesce(ReportExecutiveSummary.updated_at, ReportExecutiveSummary.created_at)
+    ).filter(ReportExecutiveSummary.report_id == report.id).scalar()
+
+    return cache_key(
+        report.id,
+        report.change_counter,
+        report.status,
+        report.updated_at,
+        report.pdf_generated_at,
+        snapshot_count,
+        snapshot_changed_at,
+        summary_changed_at,
+        *table_markers(db, RENDERED_GLOBAL_MODELS)
+    )
@@ -0,0 +1,306 @@
+"""
+Chart Service for ReportForge
+
+Builds inline SVG charts for the PDF templates (WeasyPrint renders SVG
+natively, so charts stay vector in the final PDF).
+
+Each renderer takes its input series as tuples and is memoized on them:
+a chart whose data did not change since the last preview is returned from
+the cache instead of being rendered again.
+"""
+
+from collections import defaultdict
+from datetime import date
+from functools import lru_cache
+from html import escape
+from math import cos, sin, pi
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+# InfoCert palette (see templates/pdf/styles.css)
+PALETTE = (
+    '#0072CE', '#FF8C00', '#28a745', '#005a9e',
+    '#17a2b8', '#fd7e14', '#6f42c1', '#dc3545'
+)
+TEXT_COLOR = '#333'
+MUTED_COLOR = '#666'
+GRID_COLOR = '#ddd'
+
+MONTH_LABELS = ('Gen', 'Feb', 'Mar', 'Apr', 'Mag', 'Giu', 'Lug', 'Ago', 'Set', 'Ott', 'Nov', 'Dic')
+
+# Slices beyond this are folded into "Altri" in donut charts
+MAX_SLICES = 6
+
+CHART_CACHE_SIZE = 256
+
+Series = Tuple[Tuple[str, float], ...]
+
+
+def _format_amount(value: float) -> str:
+    """Compact euro label for axes (e.g. €12k, €1,2M)"""
+    if abs(value) >= 1_000_000:
+        return f"€{value / 1_000_000:.1f}M".replace('.', ',')
+    if abs(value) >= 1_000:
+        return f"€{value / 1_000:.0f}k"
+    return f"€{value:.0f}"
+
+
+def _svg(width: int, height: int, body: List[str]) -> str:
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}" '
+        f'width="100%" font-family="Helvetica, Arial, sans-serif" font-size="10">'
+        + ''.join(body)
+        + '</svg>'
+    )
+
+
+# ==================== RENDERERS (memoized) ====================
+
+@lru_cache(maxsize=CHART_CACHE_SIZE)
+def render_column_chart(series: Series, color: str = PALETTE[0], money: bool = True) -> str:
+    """Vertical bars, one per (label, value) pair"""
+    width, height = 640, 240
+    left, right, top, bottom = 56, 8, 12, 28
+    plot_w, plot_h = width - left - right, height - top - bottom
+
+    max_value = max((value for _, value in series), default=0) or 1
+    body = []
+
+    # Horizontal grid with 4 ticks
+    for tick in range(5):
+        value = max_value * tick / 4
+        y = top + plot_h - plot_h * tick / 4
+        label = _format_amount(value) if money else f"{value:.0f}"
+        body.append(f'<line x1="{left}" y1="{y:.1f}" x2="{width - right}" y2="{y:.1f}" stroke="{GRID_COLOR}" stroke-width="0.5"/>')
+        body.append(f'<text x="{left - 6}" y="{y + 3:.1f}" text-anchor="end" fill="{MUTED_COLOR}">{label}</text>')
+
+    slot = plot_w / max(len(series), 1)
+    bar_w = slot * 0.7
+    for index, (label, value) in enumerate(series):
+        bar_h = plot_h * max(value, 0) / max_value
+        x = left + index * slot + (slot - bar_w) / 2
+        y = top + plot_h - bar_h
+        body.append(f'<rect x="{x:.1f}" y="{y:.1f}" width="{bar_w:.1f}" height="{bar_h:.1f}" fill="{color}" rx="2"/>')
+        body.append(
+            f'<text x="{x + bar_w / 2:.1f}" y="{height - bottom + 14}" text-anchor="middle" '
+            f'fill="{TEXT_COLOR}">{escape(label)}</text>'
+        )
+
+    return _svg(width, height, body)
+
+
+@lru_cache(maxsize=CHART_CACHE_SIZE)
+def render_bar_chart(series: Series, money: bool = False) -> str:
+    """Horizontal bars with the value printed at the end of each bar"""
+    row_h = 22
+    width = 640
+    label_w, value_w, top = 170, 70, 6
+    height = top * 2 + row_h * max(len(series), 1)
+    plot_w = width - label_w - value_w
+
+    max_value = max((value for _, value in series), default=0) or 1
+    body = []
+    for index, (label, value) in enumerate(series):
+        y = top + index * row_h
+        bar_w = plot_w * max(value, 0) / max_value
+        color = PALETTE[index % len(PALETTE)]
+        text = _format_amount(value) if money else f"{value:.0f}"
+        body.append(f'<text x="{label_w - 8}" y="{y + 14}" text-anchor="end" fill="{TEXT_COLOR}">{escape(label)}</text>')
+        body.append(f'<rect x="{label_w}" y="{y + 3}" width="{bar_w:.1f}" height="{row_h - 6}" fill="{color}" rx="2"/>')
+        body.append(f'<text x="{label_w + bar_w + 6:.1f}" y="{y + 14}" fill="{MUTED_COLOR}">{text}</text>')
+
+    return _svg(width, height, body)
+
+
+@lru_cache(maxsize=CHART_CACHE_SIZE)
+def render_donut_chart(series: Series) -> str:
+    """Donut with a legend listing each slice and its share"""
+    width, height = 640, 220
+    cx, cy, radius, thickness = 110, 110, 90, 34
+    total = sum(value for _, value in series if value > 0)
+    body = []
+
+    if total <= 0:
+        body.append(f'<text x="{width / 2}" y="{height / 2}" text-anchor="middle" fill="{MUTED_COLOR}">Nessun dato</text>')
+        return _svg(width, height, body)
+
+    angle = -pi / 2
+    legend_y = 30
+    for index, (label, value) in enumerate(series):
+        if value <= 0:
+            continue
+        color = PALETTE[index % len(PALETTE)]
+        share = value / total
+        sweep = 2 * pi * share
+
+        if share >= 0.9999:
+            body.append(
+                f'<circle cx="{cx}" cy="{cy}" r="{radius - thickness / 2}" fill="none" '
+                f'stroke="{color}" stroke-width="{thickness}"/>'
+            )
+        else:
+            x1, y1 = cx + radius * cos(angle), cy + radius * sin(angle)
+            x2, y2 = cx + radius * cos(angle + sweep), cy + radius * sin(angle + sweep)
+            inner = radius - thickness
+            x3, y3 = cx + inner * cos(angle + sweep), cy + inner * sin(angle + sweep)
+            x4, y4 = cx + inner * cos(angle), cy + inner * sin(angle)
+            large = 1 if sweep > pi else 0
+            body.append(
+                f'<path d="M{x1:.2f},{y1:.2f} A{radius},{radius} 0 {large} 1 {x2:.2f},{y2:.2f} '
+                f'L{x3:.2f},{y3:.2f} A{inner},{inner} 0 {large} 0 {x4:.2f},{y4:.2f} Z" fill="{color}"/>'
+            )
+        angle += sweep
+
+        body.append(f'<rect x="250" y="{legend_y - 9}" width="10" height="10" fill="{color}"/>')
+        body.append(
+            f'<text x="266" y="{legend_y}" fill="{TEXT_COLOR}">{escape(label)} '
+            f'<tspan fill="{MUTED_COLOR}">{_format_amount(value)} ({share * 100:.0f}%)</tspan></text>'
+        )
+        legend_y += 20
+
+    return _svg(width, height, body)
+
+
+def clear_chart_cache() -> None:
+    """Drop all memoized charts (e.g. after a palette change)"""
+    for renderer in (render_column_chart, render_bar_chart, render_donut_chart):
+        renderer.cache_clear()
+
+
+# ==================== DATA AGGREGATION ====================
+
+def _top_slices(totals: Dict[str, float]) -> Series:
+    """Largest slices first, with the tail folded into 'Altri'"""
+    ranked = sorted(totals.items(), key=lambda item: (-item[1], item[0]))
+    head, tail = ranked[:MAX_SLICES], ranked[MAX_SLICES:]
+    if tail:
+        head.append(('Altri', sum(value for _, value in tail)))
+    return tuple((label, round(value, 2)) for label, value in head)
+
+
+def _add_months(day: date, months: int) -> date:
+    month_index = day.year * 12 + day.month - 1 + months
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+
+def revenue_trend_series(
+    period_end: date,
+    revenue_onetime: Sequence[Dict[str, Any]],
+    subscriptions: Sequence[Dict[str, Any]],
+    months: int = 12
+) -> Series:
+    """
+    Monthly revenue for the months ending with the report period
+
+    One-time revenue is bucketed by its date; each subscription contributes
+    its MRR to every month it was active.
+    """
+    first_month = _add_months(date(period_end.year, period_end.month, 1), -(months - 1))
+    first_index = first_month.year * 12 + first_month.month - 1
+    buckets = [0.0] * months
+
+    def bucket(day: Optional[date]) -> Optional[int]:
+        if day is None:
+            return None
+        return day.year * 12 + day.month - 1 - first_index
+
+    for revenue in revenue_onetime:
+        index = bucket(revenue.get('revenue_date'))
+        if index is not None and 0 <= index < months:
+            buckets[index] += revenue.get('amount') or 0
+
+    for subscription in subscriptions:
+        mrr = subscription.get('mrr') or 0
+        start = bucket(subscription.get('start_date'))
+        end = bucket(subscription.get('end_date'))
+        if not mrr or start is None:
+            continue
+        start = max(start, 0)
+        end = months - 1 if end is None else min(end, months - 1)
+        for index in range(start, end + 1):
+            buckets[index] += mrr
+
+    return tuple(
+        (MONTH_LABELS[_add_months(first_month, offset).month - 1], round(value, 2))
+        for offset, value in enumerate(buckets)
+    )
+
+
+def client_breakdown_series(projects: Sequence[Dict[str, Any]]) -> Series:
+    """Project revenue (capex + subscription) split evenly among its clients"""
+    totals: Dict[str, float] = defaultdict(float)
+    for project in projects:
+        financial = project.get('financial_data') or {}
+        revenue = float(financial.get('revenue_capex') or 0) + float(financial.get('revenue_subscription') or 0)
+        if not revenue:
+            continue
+        clients = [c.get('name') for c in (project.get('client_data') or []) if c.get('name')] or ['Interno']
+        for client in clients:
+            totals[client] += revenue / len(clients)
+    return _top_slices(totals)
+
+
+def cost_breakdown_series(projects: Sequence[Dict[str, Any]]) -> Series:
+    """Total project costs by category"""
+    totals: Dict[str, float] = defaultdict(float)
+    for project in projects:
+        costs = (project.get('financial_data') or {}).get('costs') or {}
+        for category, amount in costs.items():
+            totals[category.capitalize()] += float(amount or 0)
+    return _top_slices(totals)
+
+
+def project_status_series(projects: Sequence[Dict[str, Any]]) -> Series:
+    """Number of projects per status"""
+    counts: Dict[str, float] = defaultdict(float)
+    for project in projects:
+        counts[str(project.get('status') or 'N/D')] += 1
+    return tuple(sorted(counts.items(), key=lambda item: (-item[1], item[0])))
+
+
+class ChartService:
+    """Builds the chart sections enabled in a report template config"""
+
+    def build_charts(
+        self,
+        config: Dict[str, Any],
+        period_end: Optional[date],
+        projects: Sequence[Dict[str, Any]],
+        revenue_onetime: Sequence[Dict[str, Any]],
+        subscriptions: Sequence[Dict[str, Any]]
+    ) -> Dict[str, str]:
+        """
+        Build SVG markup for every chart enabled in config
+
+        Args:
+            config: Report template config (include_* chart flags)
+            period_end: Last day of the report period (anchors the trend)
+            projects: Project dicts as built by fetch_report_data
+            revenue_onetime: One-time revenue dicts as built by fetch_report_data
+            subscriptions: Subscription dicts as built by fetch_report_data
+
+        Returns:
+            Dictionary of chart name -> SVG string (only enabled charts)
+        """
+        charts = {}
+
+        if config.get('include_revenue_trend') and period_end:
+            series = revenue_trend_series(period_end, revenue_onetime, subscriptions)
+            charts['revenue_trend'] = render_column_chart(series)
+
+        if config.get('include_client_breakdown'):
+            charts['client_breakdown'] = render_donut_chart(client_breakdown_series(projects))
+
+        if config.get('include_cost_breakdown'):
+            charts['cost_breakdown'] = render_donut_chart(cost_breakdown_series(projects))
+
+        if config.get('include_project_status_chart'):
+            charts['project_status'] = render_bar_chart(project_status_series(projects))
+
+        if charts:
+            info = render_column_chart.cache_info()
+            logger.info(f"Built charts {list(charts)} (column chart cache: {info.hits} hits, {info.misses} misses)")
+
+        return charts
@@ -0,0 +1,189 @@
+"""
+Report Diff Service for ReportForge
+
+Compares two reports (typically consecutive months) project by project:
+which projects were added or removed, which fields changed and how the
+financial figures moved.
+
+Snapshots are matched with a hash join on project_id (snapshots no longer
+linked to a project fall back to their name), so the comparison is a single
+pass over both reports. A project listed more than once is matched
+occurrence by occurrence, in report order. Diffs between finalized reports
+are memoized, keyed by each report's change counter.
+
+Financial figures are read with the same tolerant parsing as the executive
+summary totals (parse_amount), so the diff and the totals agree.
+"""
+
+from collections import defaultdict, deque
+from typing import Deque, Dict, Any, Hashable, List, Optional, Tuple
+import logging
+
+from sqlalchemy.orm import Session, load_only
+
+from app.models.report import Report, ReportProjectSnapshot, ReportExecutiveSummary, ReportStatus
+from app.services.cache import LRUCache
+from app.services.summary_service import parse_amount
+
+logger = logging.getLogger(__name__)
+
+# Snapshot fields compared one by one (financial_data is compared per figure)
+COMPARED_FIELDS = ('name', 'project_type', 'status', 'description', 'start_date', 'end_date', 'notes')
+
+_SUMMARY_TOTALS = ('actual_revenue_total', 'actual_saving_total', 'actual_projects_count')
+
+_diff_cache = LRUCache(maxsize=256)
+
+
+def _match_key(snapshot: ReportProjectSnapshot) -> Hashable:
+    if snapshot.project_id is not None:
+        return ('project', snapshot.project_id)
+    return ('name', snapshot.name)
+
+
+def flatten_financial(financial_data: Optional[Dict[str, Any]], prefix: str = '') -> Dict[str, float]:
+    """Numeric leaves of financial_data keyed by dotted path (e.g. 'costs.vendor')"""
+    figures = {}
+    for key, value in (financial_data or {}).items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            figures.update(flatten_financial(value, f"{path}."))
+            continue
+        amount = parse_amount(value)
+        if amount is not None:
+            figures[path] = float(amount)
+    return figures
+
+
+def _movement(old: float, new: float) -> Dict[str, float]:
+    return {'from': old, 'to': new, 'delta': round(new - old, 2)}
+
+
+def _report_info(report: Report) -> Dict[str, Any]:
+    return {
+        'id': report.id,
+        'name': report.name,
+        'status': report.status,
+        'period_start': report.period_start,
+        'period_end': report.period_end,
+    }
+
+
+class ReportDiffService:
+    """Computes period-over-period report diffs"""
+
+    def _load_snapshots(self, db: Session, report_id: int) -> List[ReportProjectSnapshot]:
+        # Only the compared columns: the team/client/activities JSONB is never read
+        columns = [getattr(ReportProjectSnapshot, field) for field in COMPARED_FIELDS]
+        return db.query(ReportProjectSnapshot).options(load_only(
+            ReportProjectSnapshot.project_id, ReportProjectSnapshot.financial_data, *columns
+        )).filter(
+            ReportProjectSnapshot.report_id == report_id
+        ).order_by(ReportProjectSnapshot.sort_order, ReportProjectSnapshot.id).all()
+
+    def _summary_totals(self, db: Session, report_id: int) -> Dict[str, float]:
+        summary = db.query(ReportExecutiveSummary).filter(
+            ReportExecutiveSummary.report_id == report_id
+        ).first()
+        return {field: float(getattr(summary, field) or 0) if summary else 0.0 for field in _SUMMARY_TOTALS}
+
+    def compare_snapshots(
+        self,
+        old: ReportProjectSnapshot,
+        new: ReportProjectSnapshot
+    ) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, float]]]:
+        """Field changes and financial movements between two matched snapshots"""
+        fields = {
+            field: {'from': getattr(old, field), 'to': getattr(new, field)}
+            for field in COMPARED_FIELDS
+            if getattr(old, field) != getattr(new, field)
+        }
+
+        old_figures = flatten_financial(old.financial_data)
+        new_figures = flatten_financial(new.financial_data)
+        financial = {
+            key: _movement(old_figures.get(key, 0.0), new_figures.get(key, 0.0))
+            for key in sorted(old_figures.keys() | new_figures.keys())
+            if old_figures.get(key, 0.0) != new_figures.get(key, 0.0)
+        }
+        return fields, financial
+
+    def diff(self, db: Session, from_report: Report, to_report: Report) -> Dict[str, Any]:
+        """
+        Compare two reports
+
+        Args:
+            db: Database session
+            from_report: Baseline report (e.g. last month)
+            to_report: Report compared against the baseline
+
+        Returns:
+            Dictionary with from_report, to_report, added, removed, changed,
+            unchanged_count and totals (executive summary movements)
+        """
+        cacheable = from_report.status == ReportStatus.FINAL and to_report.status == ReportStatus.FINAL
+        cache_key = (
+            from_report.id, from_report.change_counter,
+            to_report.id, to_report.change_counter
+        )
+        if cacheable:
+            cached = _diff_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        # Hash join: index the baseline by match key, then probe with the other report
+        baseline_snapshots = self._load_snapshots(db, from_report.id)
+        baseline: Dict[Hashable, Deque[ReportProjectSnapshot]] = defaultdict(deque)
+        for snapshot in baseline_snapshots:
+            baseline[_match_key(snapshot)].append(snapshot)
+
+        matched = set()
+
+        added, changed = [], []
+        unchanged_count = 0
+        for snapshot in self._load_snapshots(db, to_report.id):
+            candidates = baseline.get(_match_key(snapshot))
+            if not candidates:
+                added.append({'project_id': snapshot.project_id, 'name': snapshot.name})
+                continue
+            previous = candidates.popleft()
+            matched.add(previous.id)
+
+            fields, financial = self.compare_snapshots(previous, snapshot)
+            if fields or financial:
+                changed.append({
+                    'project_id': snapshot.project_id,
+                    'name': snapshot.name,
+                    'fields': fields,
+                    'financial': financial
+                })
+            else:
+                unchanged_count += 1
+
+        removed = [
+            {'project_id': snapshot.project_id, 'name': snapshot.name}
+            for snapshot in baseline_snapshots
+            if snapshot.id not in matched
+        ]
+
+        old_totals = self._summary_totals(db, from_report.id)
+        new_totals = self._summary_totals(db, to_report.id)
+
+        result = {
+            'from_report': _report_info(from_report),
+            'to_report': _report_info(to_report),
+            'added': added,
+            'removed': removed,
+            'changed': changed,
+            'unchanged_count': unchanged_count,
+            'totals': {field: _movement(old_totals[field], new_totals[field]) for field in _SUMMARY_TOTALS}
+        }
+
+        if cacheable:
+            _diff_cache.put(cache_key, result)
+
+        logger.info(
+            f"Diff {from_report.id} -> {to_report.id}: {len(added)} added, "
+            f"{len(removed)} removed, {len(changed)} changed"
+        )
+        return result
@@ -0,0 +1,169 @@
+"""
+Report Export Service for ReportForge
+
+Builds a machine-readable JSON bundle of a report (metadata, executive
+summary, project snapshots and the same sections used by the PDF templates)
+so downstream tools can consume the numbers without rendering a PDF.
+"""
+
+from decimal import Decimal
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Iterator
+import logging
+
+import orjson
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models.report import Report, ReportProjectSnapshot, ReportExecutiveSummary, ReportStatus
+from app.services.cache import FileCache, report_fingerprint
+
+logger = logging.getLogger(__name__)
+
+BUNDLE_FORMAT_VERSION = 1
+
+# Keys of fetch_report_data() that only matter for rendering (charts and
+# timelines are SVG markup)
+_RENDER_ONLY_KEYS = ('report', 'generation_date', 'logo_path', 'version', 'charts', 'portfolio_timeline')
+
+# Per-project keys that only matter for rendering
+_RENDER_ONLY_PROJECT_KEYS = ('timeline',)
+
+_REPORT_COLUMNS = (
+    'id', 'name', 'description', 'status', 'period_start', 'period_end',
+    'template_config', 'pdf_generated_at', 'created_by', 'created_at', 'updated_at'
+)
+
+_SUMMARY_COLUMNS = (
+    'actual_revenue_total', 'actual_saving_total', 'actual_projects_count',
+    'forecast_revenue_total', 'forecast_saving_total', 'forecast_projects_count',
+    'notes', 'updated_at'
+)
+
+_SNAPSHOT_COLUMNS = (
+    'id', 'project_id', 'sort_order', 'name', 'project_type', 'status', 'description',
+    'start_date', 'end_date', 'financial_data', 'team_data', 'stakeholder_data',
+    'client_data', 'activities_data', 'notes', 'custom_fields', 'created_at', 'updated_at'
+)
+
+
+def _default(obj: Any) -> Any:
+    """orjson fallback for types it does not serialize natively"""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize to JSON bytes (dates, datetimes and enums natively, Decimal as number)"""
+    return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _columns(obj: Any, names: tuple) -> Dict[str, Any]:
+    return {name: getattr(obj, name) for name in names}
+
+
+class ReportExportService:
+    """Service for exporting reports as JSON bundles"""
+
+    def __init__(self):
+        self.cache = FileCache("exports", suffix=".json")
+
+    def _sections(self, db: Session, report_id: int) -> Dict[str, Any]:
+        """Template sections as built for the PDF, minus rendering-only keys"""
+        from app.services.pdf_service import PDFGenerationService, resolve_sections
+
+        data = PDFGenerationService().fetch_report_data(db, report_id)
+        sections = resolve_sections({key: value for key, value in data.items() if key not in _RENDER_ONLY_KEYS})
+        sections['projects'] = [
+            {key: value for key, value in project.items() if key not in _RENDER_ONLY_PROJECT_KEYS}
+            for project in sections['projects']
+        ]
+        return sections
+
+    def _header(self, db: Session, report: Report) -> Dict[str, Any]:
+        """Everything in the bundle except the snapshot list"""
+        summary = db.query(ReportExecutiveSummary).filter(
+            ReportExecutiveSummary.report_id == report.id
+        ).first()
+
+        return {
+            'format_version': BUNDLE_FORMAT_VERSION,
+            'exported_at': datetime.utcnow(),
+            'report': _columns(report, _REPORT_COLUMNS),
+            'executive_summary': _columns(summary, _SUMMARY_COLUMNS) if summary else None,
+            'sections': self._sections(db, report.id),
+        }
+
+    def _snapshots(self, db: Session, report_id: int) -> Iterator[Dict[str, Any]]:
+        query = db.query(ReportProjectSnapshot).filter(
+            ReportProjectSnapshot.report_id == report_id
+        ).order_by(ReportProjectSnapshot.sort_order, ReportProjectSnapshot.id)
+
+        for snapshot in query.yield_per(100):
+            yield _columns(snapshot, _SNAPSHOT_COLUMNS)
+
+    def build_bundle(self, db: Session, report: Report) -> Dict[str, Any]:
+        """
+        Build the full export bundle for a report
+
+        Args:
+            db: Database session
+            report: Report to export
+
+        Returns:
+            Dictionary with report, executive_summary, sections and snapshots
+        """
+        bundle = self._header(db, report)
+        bundle['snapshots'] = list(self._snapshots(db, report.id))
+        return bundle
+
+    def export_bytes(self, db: Session, report: Report) -> bytes:
+        """Serialize the bundle in one piece"""
+        logger.info(f"Exporting report {report.id} as JSON bundle")
+        return dumps(self.build_bundle(db, report))
+
+    def cached_export(self, db: Session, report: Report) -> Path:
+        """
+        Return the path of the cached bundle for a finalized report
+
+        Final reports are cached by content fingerprint; the bundle is built
+        and stored on the first request for each fingerprint.
+        """
+        if report.status != ReportStatus.FINAL:
+            raise ValueError(f"Report {report.id} is not final")
+
+        key = f"report_{report.id}_{report_fingerprint(db, report)}"
+        path = self.cache.get(key)
+        if path is None:
+            path = self.cache.put(key, self.export_bytes(db, report))
+        else:
+            logger.info(f"Serving cached JSON bundle for report {report.id}")
+        return path
+
+    def stream_export(self, report_id: int) -> Iterator[bytes]:
+        """
+        Serialize the bundle incrementally
+
+        Snapshots are fetched in batches and written one at a time, so memory
+        stays flat for large reports. Uses its own session because request
+        dependencies are closed before a streaming response is sent.
+        """
+        db = SessionLocal()
+        try:
+            report = db.query(Report).filter(Report.id == report_id).first()
+            if not report:
+                raise ValueError(f"Report with id {report_id} not found")
+
+            header = dumps(self._header(db, report))
+            yield header[:-1] + b',"snapshots":['
+
+            separator = b''
+            for snapshot in self._snapshots(db, report_id):
+                yield separator + dumps(snapshot)
+                separator = b','
+
+            yield b']}'
+        finally:
+            db.close()
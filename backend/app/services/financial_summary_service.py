@@ -0,0 +1,169 @@
+"""
+Project Financial Summary Service for ReportForge
+
+Keeps project_financial_summary - one row of revenue, subscription and
+cost totals per project - current, so snapshots, project lists and PDFs
+read a single row per project instead of summing revenue_one_time,
+subscriptions and project_costs every time.
+
+Every endpoint that writes one of those tables calls
+refresh_project_financials() for the affected project before committing.
+The refresh recomputes the project's row from its source rows (one
+INSERT ... SELECT ... ON CONFLICT DO UPDATE), so the totals cannot drift
+the way accumulated deltas could; the project row is locked first so two
+concurrent writes to the same project are applied one after the other.
+create_project adds a project's (zero) row straight away, and init_db
+backfills rows only for projects that have none, so startup cost does not
+grow with the data.
+"""
+
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence
+import logging
+
+from sqlalchemy import case, exists, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.models.project import Project, ProjectCost, ProjectFinancialSummary, CostCategory
+from app.models.subscription import FinancialImpactType, RevenueOneTime, Subscription
+
+logger = logging.getLogger(__name__)
+
+TOTAL_COLUMNS = (
+    'revenue_capex', 'revenue_subscription', 'saving_subscription', 'subscriptions_total',
+    'cost_internal', 'cost_vendor', 'cost_infrastructure'
+)
+
+
+def _sum_where(column, condition):
+    return func.coalesce(func.sum(case((condition, column), else_=0)), 0)
+
+
+def refresh_project_financials(db: Session, project_ids: Optional[Iterable[Optional[int]]] = None) -> None:
+    """
+    Recompute the financial summary rows of some projects (does not commit)
+
+    Args:
+        db: Database session
+        project_ids: Projects to refresh (None values are ignored);
+            None recomputes every project (full rebuild)
+    """
+    ids = None
+    if project_ids is not None:
+        ids = sorted({project_id for project_id in project_ids if project_id is not None})
+        if not ids:
+            return
+        # Serialize concurrent refreshes of the same project (FOR NO KEY
+        # UPDATE does not block child inserts referencing the project)
+        db.query(Project.id).filter(Project.id.in_(ids)).order_by(Project.id).with_for_update(key_share=True).all()
+
+    _upsert_summaries(db, (lambda project_id_column: project_id_column.in_(ids)) if ids is not None else None)
+
+
+def backfill_project_financials(db: Session) -> int:
+    """
+    Create the summary rows of projects that have none (does not commit)
+
+    Returns:
+        Number of rows created
+    """
+    def without_summary(project_id_column):
+        return ~exists().where(ProjectFinancialSummary.project_id == project_id_column)
+
+    return _upsert_summaries(db, without_summary)
+
+
+def _upsert_summaries(db: Session, scope: Optional[Callable[[Any], Any]]) -> int:
+    """Recompute the summary rows of the projects matched by scope(project_id column), or all"""
+    def scoped(query, project_id_column):
+        return query.where(scope(project_id_column)) if scope is not None else query
+
+    revenue = scoped(
+        select(
+            RevenueOneTime.project_id,
+            func.sum(RevenueOneTime.amount).label('revenue_capex')
+        ),
+        RevenueOneTime.project_id
+    ).group_by(RevenueOneTime.project_id).subquery()
+
+    subscriptions = scoped(
+        select(
+            Subscription.project_id,
+            _sum_where(Subscription.annual_value, Subscription.impact_type == FinancialImpactType.REVENUE_SUBSCRIPTION).label('revenue_subscription'),
+            _sum_where(Subscription.annual_value, Subscription.impact_type == FinancialImpactType.SAVING_SUBSCRIPTION).label('saving_subscription'),
+            func.sum(Subscription.annual_value).label('subscriptions_total')
+        ),
+        Subscription.project_id
+    ).group_by(Subscription.project_id).subquery()
+
+    costs = scoped(
+        select(
+            ProjectCost.project_id,
+            _sum_where(ProjectCost.amount, ProjectCost.category == CostCategory.INTERNAL).label('cost_internal'),
+            _sum_where(ProjectCost.amount, ProjectCost.category == CostCategory.VENDOR).label('cost_vendor'),
+            _sum_where(ProjectCost.amount, ProjectCost.category == CostCategory.INFRASTRUCTURE).label('cost_infrastructure')
+        ),
+        ProjectCost.project_id
+    ).group_by(ProjectCost.project_id).subquery()
+
+    source = scoped(
+        select(
+            Project.id,
+            func.coalesce(revenue.c.revenue_capex, 0),
+            func.coalesce(subscriptions.c.revenue_subscription, 0),
+            func.coalesce(subscriptions.c.saving_subscription, 0),
+            func.coalesce(subscriptions.c.subscriptions_total, 0),
+            func.coalesce(costs.c.cost_internal, 0),
+            func.coalesce(costs.c.cost_vendor, 0),
+            func.coalesce(costs.c.cost_infrastructure, 0)
+        ).outerjoin(
+            revenue, revenue.c.project_id == Project.id
+        ).outerjoin(
+            subscriptions, subscriptions.c.project_id == Project.id
+        ).outerjoin(
+            costs, costs.c.project_id == Project.id
+        ),
+        Project.id
+    )
+
+    table = ProjectFinancialSummary.__table__
+    statement = insert(table).from_select(['project_id', *TOTAL_COLUMNS], source)
+    statement = statement.on_conflict_do_update(
+        index_elements=[table.c.project_id],
+        set_={**{column: statement.excluded[column] for column in TOTAL_COLUMNS}, 'updated_at': func.now()}
+    )
+    return db.execute(statement).rowcount
+
+
+def to_financial_data(summary: Optional[ProjectFinancialSummary]) -> Dict[str, Any]:
+    """Snapshot financial_data of a project from its summary row (zeros if missing)"""
+    def amount(column: str) -> float:
+        return float(getattr(summary, column)) if summary is not None else 0.0
+
+    return {
+        "revenue_capex": amount('revenue_capex'),
+        "revenue_subscription": amount('revenue_subscription'),
+        "saving_capex": 0,  # TODO: Calculate from one-time saving
+        "saving_subscription": amount('saving_subscription'),
+        "costs": {
+            "internal": amount('cost_internal'),
+            "vendor": amount('cost_vendor'),
+            "infrastructure": amount('cost_infrastructure')
+        }
+    }
+
+
+def load_summaries(db: Session, project_ids: Sequence[int]) -> Dict[int, ProjectFinancialSummary]:
+    """Summary rows of many projects, keyed by project ID (one query)"""
+    if not project_ids:
+        return {}
+    rows = db.query(ProjectFinancialSummary).filter(ProjectFinancialSummary.project_id.in_(set(project_ids)))
+    return {row.project_id: row for row in rows}
+
+
+def portfolio_totals(db: Session) -> Dict[str, Decimal]:
+    """Totals over all projects (one aggregate over the summary rows)"""
+    columns = [func.coalesce(func.sum(getattr(ProjectFinancialSummary, column)), 0).label(column) for column in TOTAL_COLUMNS]
+    row = db.query(*columns).one()
+    return dict(row._mapping)
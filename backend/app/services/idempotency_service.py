@@ -0,0 +1,107 @@
+"""
+Idempotency Service for ReportForge
+
+Makes create endpoints safe to retry: a request carrying an Idempotency-Key
+header claims the key in the same transaction as the work it protects.
+
+- The claim is an INSERT ... ON CONFLICT DO NOTHING on (key, scope). A retry
+  that arrives while the first request is still running waits on the unique
+  index until that transaction ends, so the work is never done twice.
+- On commit the key records the ID of the created resource; retries return
+  that resource instead of creating a new one. If the first request fails,
+  its rollback releases the key.
+- Keys expire after KEY_TTL and expired keys are purged as new ones are
+  claimed.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+import logging
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.models.idempotency import IdempotencyKey
+from app.services.cache import cache_key
+
+logger = logging.getLogger(__name__)
+
+KEY_TTL = timedelta(hours=24)
+
+
+class IdempotencyConflictError(Exception):
+    """Raised when a key is reused for a different request"""
+
+
+class IdempotencyClaim:
+    """Result of claiming a key: either new work or a replay"""
+
+    def __init__(self, record_id: Optional[int], resource_id: Optional[int]):
+        self.record_id = record_id
+        self.resource_id = resource_id
+
+    @property
+    def is_replay(self) -> bool:
+        return self.resource_id is not None
+
+
+class IdempotencyService:
+    """Claims and completes idempotency keys"""
+
+    def claim(self, db: Session, key: str, scope: str, payload: Any) -> IdempotencyClaim:
+        """
+        Claim a key for a request (does not commit)
+
+        Args:
+            db: Database session (the claim joins its transaction)
+            key: Idempotency-Key header value
+            scope: Endpoint the key applies to (e.g. 'copy_report:12')
+            payload: JSON-serializable request body
+
+        Returns:
+            IdempotencyClaim; is_replay is True if the request already succeeded
+
+        Raises:
+            IdempotencyConflictError: If the key was used with a different body
+        """
+        request_hash = cache_key(scope, payload)
+        now = datetime.now(timezone.utc)
+
+        for _ in range(2):
+            record_id = db.execute(
+                insert(IdempotencyKey).values(
+                    key=key, scope=scope, request_hash=request_hash, expires_at=now + KEY_TTL
+                ).on_conflict_do_nothing(
+                    index_elements=['key', 'scope']
+                ).returning(IdempotencyKey.id)
+            ).scalar()
+
+            if record_id is not None:
+                db.execute(delete(IdempotencyKey).where(IdempotencyKey.expires_at < now))
+                return IdempotencyClaim(record_id, None)
+
+            existing = db.execute(
+                select(IdempotencyKey).where(IdempotencyKey.key == key, IdempotencyKey.scope == scope)
+            ).scalar_one_or_none()
+
+            if existing is None:
+                continue  # Released by a rollback in the meantime
+            if existing.expires_at < now:
+                db.execute(delete(IdempotencyKey).where(IdempotencyKey.id == existing.id))
+                continue
+            if existing.request_hash != request_hash:
+                raise IdempotencyConflictError("Idempotency-Key was already used with a different request")
+            if existing.resource_id is None:
+                raise IdempotencyConflictError("A request with this Idempotency-Key is still in progress")
+
+            logger.info(f"Replaying {scope} for Idempotency-Key {key}")
+            return IdempotencyClaim(existing.id, existing.resource_id)
+
+        raise IdempotencyConflictError("Could not claim Idempotency-Key")
+
+    def complete(self, db: Session, claim: IdempotencyClaim, resource_id: int) -> None:
+        """Record the resource created under a claimed key (does not commit)"""
+        db.execute(
+            update(IdempotencyKey).where(IdempotencyKey.id == claim.record_id).values(resource_id=resource_id)
+        )
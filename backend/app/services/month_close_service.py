@@ -0,0 +1,242 @@
+"""
+Month Close Pipeline for ReportForge
+
+Runs the month-close chain - create the draft, add the active projects,
+calculate the executive summary, render the PDF, finalize - over all
+reports of a period, as a generator that yields one event per report and
+stage so callers can stream progress. prepare() does the validation and
+draft creation up front, so a bad request fails before anything streams.
+
+Every stage runs in its own transaction and records a checkpoint
+(pipeline_checkpoints) in that same transaction, so a stage's work and
+its "completed" mark commit together. Re-running the same period resumes:
+completed stages are skipped and only failed or never-reached stages run.
+A failed stage is recorded with its error and stops the remaining stages
+of that report; the other reports carry on.
+"""
+
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+import logging
+
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models.pipeline import PipelineCheckpoint
+from app.models.report import Report, ReportProjectSnapshot, ReportStatus
+from app.services.cache import bump_change_counter
+from app.services.pregeneration_service import DraftPregenerationService
+from app.services.snapshot_service import SnapshotService
+from app.services.summary_service import SummaryService, apply_summary_delta, sum_totals
+
+logger = logging.getLogger(__name__)
+
+STAGES = ('add_projects', 'calculate', 'generate_pdf', 'finalize')
+
+COMPLETED = 'completed'
+FAILED = 'failed'
+SKIPPED = 'skipped'
+
+
+def record_checkpoint(
+    db: Session,
+    run_key: str,
+    report_id: int,
+    stage: str,
+    status: str,
+    error: Optional[str] = None
+) -> None:
+    """Upsert the checkpoint of a stage (does not commit)"""
+    table = PipelineCheckpoint.__table__
+    statement = insert(table).values(
+        run_key=run_key, report_id=report_id, stage=stage, status=status, error=error
+    )
+    statement = statement.on_conflict_do_update(
+        index_elements=[table.c.run_key, table.c.report_id, table.c.stage],
+        set_={
+            'status': statement.excluded.status,
+            'error': statement.excluded.error,
+            'attempts': table.c.attempts + 1,
+            'updated_at': func.now()
+        }
+    )
+    db.execute(statement)
+
+
+class MonthCloseNotFoundError(LookupError):
+    """Raised when the template or a report requested for a month close does not exist"""
+
+
+class MonthClosePipeline:
+    """Resumable month-close runner"""
+
+    def __init__(self, finalize: bool = True, session_factory: Callable[[], Session] = SessionLocal):
+        self.stages = STAGES if finalize else STAGES[:-1]
+        self.session_factory = session_factory
+
+    @staticmethod
+    def run_key(period_start: date) -> str:
+        return f"month_close:{period_start:%Y-%m}"
+
+    def prepare(
+        self,
+        db: Session,
+        period_start: date,
+        period_end: date,
+        report_ids: Optional[Sequence[int]] = None,
+        template_id: Optional[int] = None
+    ) -> List[Tuple[int, str]]:
+        """
+        Validate a month close and create the period's draft if needed
+        (does not commit)
+
+        Everything that can be rejected is checked here, before run() starts
+        streaming events.
+
+        Args:
+            db: Database session
+            period_start: First day of the period
+            period_end: Last day of the period
+            report_ids: Reports to close (default: every report of the
+                period, creating the draft first if there is none)
+            template_id: Template for a newly created draft
+
+        Returns:
+            (report_id, status) of the reports to close, ordered by ID
+
+        Raises:
+            MonthCloseNotFoundError: If the template or a report does not exist
+            ValueError: If a report belongs to another period
+        """
+        in_period = Report.period_start.between(period_start, period_end)
+        query = db.query(Report.id, Report.status, in_period.label('in_period'))
+
+        if report_ids is None:
+            drafts = DraftPregenerationService()
+            try:
+                drafts.resolve_template(db, template_id)
+            except ValueError as e:
+                raise MonthCloseNotFoundError(str(e))
+            drafts.create_draft(db, period_start, period_end, template_id)
+            query = query.filter(in_period)
+        else:
+            query = query.filter(Report.id.in_(report_ids))
+
+        rows = query.order_by(Report.id).all()
+
+        if report_ids is not None:
+            missing = sorted(set(report_ids) - {row.id for row in rows})
+            if missing:
+                raise MonthCloseNotFoundError(f"Reports not found: {missing}")
+            outside = [row.id for row in rows if not row.in_period]
+            if outside:
+                raise ValueError(f"Reports {outside} do not belong to {period_start:%Y-%m}")
+
+        return [(row.id, row.status) for row in rows]
+
+    def run(self, period_start: date, reports: Sequence[Tuple[int, str]]) -> Iterator[Dict[str, Any]]:
+        """
+        Run the stages of prepared reports, yielding an event per report and stage
+
+        Args:
+            period_start: First day of the period (names the run)
+            reports: (report_id, status) pairs returned by prepare()
+
+        Yields:
+            Dictionaries with run_key, report_id, stage, status
+            (completed / failed / skipped) and error
+        """
+        run_key = self.run_key(period_start)
+
+        db = self.session_factory()
+        try:
+            done = self._completed_stages(db, run_key)
+        finally:
+            db.close()
+
+        for report_id, report_status in reports:
+            for stage in self.stages:
+                if (report_id, stage) in done or report_status == ReportStatus.FINAL:
+                    yield self._event(run_key, report_id, stage, SKIPPED)
+                    continue
+
+                event = self._run_stage(run_key, report_id, stage)
+                yield event
+                if event['status'] == FAILED:
+                    break
+
+    def _completed_stages(self, db: Session, run_key: str) -> Set[Tuple[int, str]]:
+        return {
+            (row.report_id, row.stage)
+            for row in db.query(PipelineCheckpoint.report_id, PipelineCheckpoint.stage).filter(
+                PipelineCheckpoint.run_key == run_key,
+                PipelineCheckpoint.status == COMPLETED
+            )
+        }
+
+    def _run_stage(self, run_key: str, report_id: int, stage: str) -> Dict[str, Any]:
+        db = self.session_factory()
+        try:
+            getattr(self, f"_{stage}")(db, report_id)
+            record_checkpoint(db, run_key, report_id, stage, COMPLETED)
+            db.commit()
+            return self._event(run_key, report_id, stage, COMPLETED)
+        except Exception as e:
+            logger.error(f"{run_key}: stage {stage} of report {report_id} failed: {e}")
+            db.rollback()
+            record_checkpoint(db, run_key, report_id, stage, FAILED, str(e))
+            db.commit()
+            return self._event(run_key, report_id, stage, FAILED, str(e))
+        finally:
+            db.close()
+
+    @staticmethod
+    def _event(run_key: str, report_id: int, stage: str, status: str, error: Optional[str] = None) -> Dict[str, Any]:
+        return {'run_key': run_key, 'report_id': report_id, 'stage': stage, 'status': status, 'error': error}
+
+    # Stages -----------------------------------------------------------------
+
+    def _add_projects(self, db: Session, report_id: int) -> None:
+        """Snapshot active projects that are not in the report yet"""
+        existing = {
+            row.project_id for row in db.query(ReportProjectSnapshot.project_id).filter(
+                ReportProjectSnapshot.report_id == report_id
+            )
+        }
+        missing = [
+            project_id for project_id in DraftPregenerationService().active_project_ids(db)
+            if project_id not in existing
+        ]
+        if not missing:
+            return
+
+        last_order = db.query(func.max(ReportProjectSnapshot.sort_order)).filter(
+            ReportProjectSnapshot.report_id == report_id
+        ).scalar()
+        start_order = 0 if last_order is None else last_order + 1
+
+        rows = SnapshotService().create_snapshots(db, report_id, missing, start_order=start_order)
+        revenue, saving = sum_totals(row["financial_data"] for row in rows)
+        apply_summary_delta(db, report_id, revenue, saving, len(rows))
+        bump_change_counter(db, report_id)
+
+    def _calculate(self, db: Session, report_id: int) -> None:
+        SummaryService().recompute(db, report_id)
+        bump_change_counter(db, report_id)
+
+    def _generate_pdf(self, db: Session, report_id: int) -> None:
+        from app.services.pdf_service import PDFGenerationService
+
+        PDFGenerationService().get_cached_pdf(db, report_id)
+
+    def _finalize(self, db: Session, report_id: int) -> None:
+        from app.services.version_service import VersionService
+
+        report = db.query(Report).filter(Report.id == report_id).one()
+        report.status = ReportStatus.FINAL
+        report.pdf_generated_at = datetime.utcnow()
+        bump_change_counter(db, report_id)
+        db.flush()
+        VersionService().capture(db, report, notes="Finalized")
@@ -5,21 +5,99 @@ Fetches report data from database and generates PDF using WeasyPrint + Jinja2 te
 """
 
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Callable, Iterable, List, Optional
 from datetime import datetime
 import logging
 
-from sqlalchemy.orm import Session
+from sqlalchemy import func
+from sqlalchemy.orm import Session, selectinload, joinedload
 from jinja2 import Environment, FileSystemLoader
 from weasyprint import HTML
 
 from app.models.report import Report, ReportProjectSnapshot, ReportTemplate
-from app.models.project import Project, Client, TeamMember, Stakeholder
+from app.models.project import Project, ProjectClient, ProjectTeam, TeamMember, Stakeholder
 from app.models.subscription import Subscription, RevenueOneTime
+from app.services.cache import FileCache, report_fingerprint
+from app.services.chart_service import ChartService
+from app.services.financial_summary_service import TOTAL_COLUMNS, portfolio_totals
+from app.services.timeline_service import TimelineService
 
 logger = logging.getLogger(__name__)
 
 
+class LazySection:
+    """
+    Template value loaded from the database on first access
+    
+    Behaves like the list or dict returned by its provider (iteration, len,
+    truthiness, indexing, attribute lookup), so Jinja templates use it
+    unchanged. The provider runs at most once.
+    """
+    
+    def __init__(self, name: str, provider: Callable[[], Any]):
+        self.name = name
+        self._provider = provider
+        self._loaded = False
+        self._value = None
+    
+    def resolve(self) -> Any:
+        """Run the provider (once) and return its value"""
+        if not self._loaded:
+            logger.debug(f"Loading report section '{self.name}'")
+            self._value = self._provider()
+            self._loaded = True
+        return self._value
+    
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+    
+    def __getattr__(self, attr: str) -> Any:
+        # Never load on interpreter/Jinja protocol probes (e.g. __html__)
+        if attr.startswith('__'):
+            raise AttributeError(attr)
+        value = self.resolve()
+        if hasattr(value, attr):
+            return getattr(value, attr)
+        if isinstance(value, dict) and attr in value:
+            return value[attr]
+        raise AttributeError(attr)
+    
+    def __getitem__(self, key: Any) -> Any:
+        return self.resolve()[key]
+    
+    def __iter__(self):
+        return iter(self.resolve() or ())
+    
+    def __len__(self) -> int:
+        return len(self.resolve() or ())
+    
+    def __bool__(self) -> bool:
+        return bool(self.resolve())
+    
+    def __contains__(self, item: Any) -> bool:
+        return item in (self.resolve() or ())
+    
+    def __repr__(self) -> str:
+        state = repr(self._value) if self._loaded else 'not loaded'
+        return f"<LazySection {self.name}: {state}>"
+
+
+def resolve_sections(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of fetch_report_data() output with every lazy section loaded"""
+    return {
+        key: value.resolve() if isinstance(value, LazySection) else value
+        for key, value in data.items()
+    }
+
+
+def _client_name(project: Optional[Project], default: str) -> str:
+    """Name of the project's first client, or default"""
+    if project is not None and project.clients:
+        return project.clients[0].client.name
+    return default
+
+
 class PDFGenerationService:
     """Service for generating PDF reports from database data"""
     
@@ -35,6 +113,7 @@ class PDFGenerationService:
         
         self.template_dir = template_dir
         self.jinja_env = Environment(loader=FileSystemLoader(str(template_dir)))
+        self.pdf_cache = FileCache("pdf", suffix=".pdf")
         
         logger.info(f"PDFGenerationService initialized with template_dir: {template_dir}")
     
@@ -42,6 +121,16 @@ class PDFGenerationService:
         """
         Fetch all data needed for report generation from database
         
+        Only the report row is loaded here. Every section used by
+        base.html is a LazySection whose provider queries the database the
+        first time the template touches it, so disabled or trimmed sections
+        cost nothing. Use resolve_sections() to get plain values.
+        
+        As before lazy loading, show_revenue_details: false empties the
+        subscription and revenue lists and zeroes the totals derived from
+        them, and show_team_stakeholders: false empties the team and
+        stakeholder lists.
+        
         Args:
             db: Database session
             report_id: Report ID
@@ -75,10 +164,80 @@ class PDFGenerationService:
                 'show_back_cover': True
             }
         
-        # Get project snapshots
-        snapshots = db.query(ReportProjectSnapshot).filter(
+        show_revenue = config.get('show_revenue_details', True)
+        show_team = config.get('show_team_stakeholders', True)
+        
+        snapshots = LazySection('snapshots', lambda: self._load_snapshots(db, report_id))
+        projects = LazySection('projects', lambda: self._build_projects(snapshots, config))
+        subscriptions = LazySection(
+            'subscriptions', lambda: self._load_subscriptions(db) if show_revenue else []
+        )
+        revenue_onetime = LazySection(
+            'revenue_onetime', lambda: self._load_revenue_onetime(db) if show_revenue else []
+        )
+        financial_totals = LazySection(
+            'financial_totals',
+            lambda: portfolio_totals(db) if show_revenue else {column: 0 for column in TOTAL_COLUMNS}
+        )
+        
+        # Build data structure for template
+        data = {
+            'report': {
+                'id': report.id,
+                'name': report.name,
+                'description': report.description,
+                'period_start': report.period_start,
+                'period_end': report.period_end,
+                'author_email': report.created_by if hasattr(report, 'created_by') else None
+            },
+            'config': config,
+            'executive_summary': LazySection(
+                'executive_summary',
+                lambda: self._build_executive_summary(report, financial_totals)
+            ),
+            'projects': projects,
+            'team_members': LazySection(
+                'team_members', lambda: self._load_team_members(db) if show_team else []
+            ),
+            'stakeholders': LazySection(
+                'stakeholders', lambda: self._load_stakeholders(db) if show_team else []
+            ),
+            'subscriptions': subscriptions,
+            'revenue_onetime': revenue_onetime,
+            'savings': [],  # TODO: Add savings data when model exists
+            'financial': LazySection(
+                'financial',
+                lambda: self._build_financial(financial_totals)
+            ),
+            # Charts (only those enabled by include_* flags in the template config)
+            'charts': LazySection(
+                'charts',
+                lambda: ChartService().build_charts(
+                    config, report.period_end, projects, revenue_onetime, subscriptions
+                )
+            ),
+            'portfolio_timeline': LazySection(
+                'portfolio_timeline',
+                lambda: TimelineService().portfolio_timeline(snapshots)
+                if config.get('include_project_timeline') else None
+            ),
+            'generation_date': datetime.now(),
+            'logo_path': None,  # TODO: Add logo handling
+            'version': '0.5.0'
+        }
+        
+        return data
+    
+    # ==================== SECTION PROVIDERS ====================
+    
+    def _load_snapshots(self, db: Session, report_id: int) -> List[ReportProjectSnapshot]:
+        return db.query(ReportProjectSnapshot).filter(
             ReportProjectSnapshot.report_id == report_id
-        ).all()
+        ).order_by(ReportProjectSnapshot.sort_order, ReportProjectSnapshot.id).all()
+    
+    def _build_projects(self, snapshots: Iterable[ReportProjectSnapshot], config: Dict[str, Any]) -> List[Dict[str, Any]]:
+        include_timeline = config.get('include_project_timeline', False)
+        timeline_service = TimelineService()
         
         projects = []
         for snapshot in snapshots:
@@ -104,96 +263,92 @@ class PDFGenerationService:
             if snapshot.custom_fields:
                 project_data.update(snapshot.custom_fields)
             
+            if include_timeline:
+                project_data['timeline'] = timeline_service.project_timeline(snapshot)
+            
             projects.append(project_data)
         
-        # Get subscriptions
+        return projects
+    
+    def _load_subscriptions(self, db: Session) -> List[Dict[str, Any]]:
+        subs = db.query(Subscription).options(
+            selectinload(Subscription.project).selectinload(Project.clients).joinedload(ProjectClient.client)
+        ).all()
+        
         subscriptions = []
-        if config.get('show_revenue_details', True):
-            subs = db.query(Subscription).all()
-            for sub in subs:
-                # Get project for client name
-                project = None
-                client_name = 'Unknown'
-                if sub.project_id:
-                    project = db.query(Project).filter(Project.id == sub.project_id).first()
-                    if project:
-                        client_name = project.name
-                        if hasattr(project, 'clients') and project.clients:
-                            client_name = project.clients[0].name
-                
-                subscriptions.append({
-                    'client_name': client_name,
-                    'description': sub.description or '',
-                    'start_date': sub.start_date,
-                    'end_date': sub.end_date,
-                    'mrr': float(sub.annual_value / 12) if sub.annual_value else 0,
-                    'arr': float(sub.annual_value) if sub.annual_value else 0,
-                    'status': 'Active' if not sub.end_date else 'Ended'
-                })
-        
-        # Get one-time revenue
+        for sub in subs:
+            subscriptions.append({
+                'client_name': _client_name(sub.project, default=sub.project.name if sub.project else 'Unknown'),
+                'description': sub.description or '',
+                'start_date': sub.start_date,
+                'end_date': sub.end_date,
+                'mrr': float(sub.annual_value / 12) if sub.annual_value else 0,
+                'arr': float(sub.annual_value) if sub.annual_value else 0,
+                'status': 'Active' if not sub.end_date else 'Ended'
+            })
+        return subscriptions
+    
+    def _load_revenue_onetime(self, db: Session) -> List[Dict[str, Any]]:
+        revenues = db.query(RevenueOneTime).options(
+            selectinload(RevenueOneTime.project).selectinload(Project.clients).joinedload(ProjectClient.client)
+        ).all()
+        
         revenue_onetime = []
-        if config.get('show_revenue_details', True):
-            revenues = db.query(RevenueOneTime).all()
-            for rev in revenues:
-                # Get project for client name
-                project = None
-                client_name = 'Unknown'
-                project_name = 'Unknown'
-                if rev.project_id:
-                    project = db.query(Project).filter(Project.id == rev.project_id).first()
-                    if project:
-                        project_name = project.name
-                        if hasattr(project, 'clients') and project.clients:
-                            client_name = project.clients[0].name
-                
-                revenue_onetime.append({
-                    'client_name': client_name,
-                    'project_name': project_name,
-                    'partner_name': None,
-                    'revenue_date': rev.date,
-                    'amount': float(rev.amount) if rev.amount else 0,
-                    'status': 'Forecast' if rev.is_forecast else 'Actual',
-                    'notes': rev.description
-                })
-        
-        # Calculate financial summary
-        total_subscriptions = sum(s['arr'] for s in subscriptions)
-        total_revenue_onetime = sum(r['amount'] for r in revenue_onetime)
-        
-        # Get team members (from report metadata or all active)
-        team_members = []
-        if config.get('show_team_stakeholders', True):
-            members = db.query(TeamMember).all()
-            for member in members[:10]:  # Limit to top 10
-                # Count projects
-                project_count = 0
-                if hasattr(member, 'projects'):
-                    project_count = len(member.projects)
-                
-                team_members.append({
-                    'name': member.full_name,
-                    'role': member.role or '',
-                    'email': member.email or '',
-                    'project_count': project_count
-                })
-        
-        # Get stakeholders
-        stakeholders_list = []
-        if config.get('show_team_stakeholders', True):
-            stakeholders_db = db.query(Stakeholder).all()
-            for sh in stakeholders_db[:10]:  # Limit to top 10
-                stakeholders_list.append({
-                    'name': sh.name,
-                    'organization': sh.name,  # Stakeholder name is the organization
-                    'role': '',
-                    'email': ''
-                })
+        for rev in revenues:
+            project = rev.project
+            revenue_onetime.append({
+                'client_name': _client_name(project, default='Unknown') if project else 'Unknown',
+                'project_name': project.name if project else 'Unknown',
+                'partner_name': None,
+                'revenue_date': rev.date,
+                'amount': float(rev.amount) if rev.amount else 0,
+                'status': 'Forecast' if rev.is_forecast else 'Actual',
+                'notes': rev.description
+            })
+        return revenue_onetime
+    
+    def _load_team_members(self, db: Session) -> List[Dict[str, Any]]:
+        members = db.query(TeamMember).order_by(TeamMember.id).limit(10).all()  # Limit to top 10
+        
+        # Count projects per member in one grouped query
+        project_counts = dict(
+            db.query(ProjectTeam.team_member_id, func.count(ProjectTeam.id))
+            .filter(ProjectTeam.team_member_id.in_([m.id for m in members]))
+            .group_by(ProjectTeam.team_member_id)
+            .all()
+        ) if members else {}
         
+        return [
+            {
+                'name': member.full_name,
+                'role': member.role or '',
+                'email': member.email or '',
+                'project_count': project_counts.get(member.id, 0)
+            }
+            for member in members
+        ]
+    
+    def _load_stakeholders(self, db: Session) -> List[Dict[str, Any]]:
+        stakeholders_db = db.query(Stakeholder).order_by(Stakeholder.id).limit(10).all()  # Limit to top 10
+        return [
+            {
+                'name': sh.name,
+                'organization': sh.name,  # Stakeholder name is the organization
+                'role': '',
+                'email': ''
+            }
+            for sh in stakeholders_db
+        ]
+    
+    def _build_executive_summary(
+        self,
+        report: Report,
+        financial_totals: "LazySection"
+    ) -> Dict[str, Any]:
         # Executive summary from report metadata or calculate
         exec_summary_obj = report.executive_summary
         if exec_summary_obj and hasattr(exec_summary_obj, 'actual_revenue_total'):
-            executive_summary = {
+            return {
                 'overview_text': exec_summary_obj.notes or report.description or '',
                 'year_current': report.period_start.year if report.period_start else datetime.now().year,
                 'year_forecast': (report.period_start.year + 1) if report.period_start else datetime.now().year + 1,
@@ -205,19 +360,24 @@ class PDFGenerationService:
                 'saving_forecast': float(exec_summary_obj.forecast_saving_total or 0),
                 'total_forecast': float(exec_summary_obj.forecast_revenue_total or 0) + float(exec_summary_obj.forecast_saving_total or 0)
             }
-        else:
-            executive_summary = {
-                'overview_text': report.description or '',
-                'year_current': report.period_start.year if report.period_start else datetime.now().year,
-                'year_forecast': (report.period_start.year + 1) if report.period_start else datetime.now().year + 1,
-                'revenue_current': total_subscriptions + total_revenue_onetime,
-                'saving_current': 0,
-                'total_current': total_subscriptions + total_revenue_onetime,
-                'show_forecast': False
-            }
         
-        # Financial overview
-        financial = {
+        total_revenue = float(financial_totals['subscriptions_total'] + financial_totals['revenue_capex'])
+        return {
+            'overview_text': report.description or '',
+            'year_current': report.period_start.year if report.period_start else datetime.now().year,
+            'year_forecast': (report.period_start.year + 1) if report.period_start else datetime.now().year + 1,
+            'revenue_current': total_revenue,
+            'saving_current': 0,
+            'total_current': total_revenue,
+            'show_forecast': False
+        }
+    
+    def _build_financial(self, financial_totals: "LazySection") -> Dict[str, Any]:
+        # Portfolio totals from the precomputed per-project summaries
+        total_subscriptions = float(financial_totals['subscriptions_total'])
+        total_revenue_onetime = float(financial_totals['revenue_capex'])
+        
+        return {
             'subscriptions_revenue': total_subscriptions,
             'onetime_revenue': total_revenue_onetime,
             'total_revenue': total_subscriptions + total_revenue_onetime,
@@ -226,32 +386,6 @@ class PDFGenerationService:
             'total_saving': 0,
             'breakdown': []
         }
-        
-        # Build data structure for template
-        data = {
-            'report': {
-                'id': report.id,
-                'name': report.name,
-                'description': report.description,
-                'period_start': report.period_start,
-                'period_end': report.period_end,
-                'author_email': report.created_by if hasattr(report, 'created_by') else None
-            },
-            'config': config,
-            'executive_summary': executive_summary,
-            'projects': projects,
-            'team_members': team_members,
-            'stakeholders': stakeholders_list,
-            'subscriptions': subscriptions,
-            'revenue_onetime': revenue_onetime,
-            'savings': [],  # TODO: Add savings data when model exists
-            'financial': financial,
-            'generation_date': datetime.now(),
-            'logo_path': None,  # TODO: Add logo handling
-            'version': '0.5.0'
-        }
-        
-        return data
     
     def generate_pdf(
         self,
@@ -307,6 +441,36 @@ class PDFGenerationService:
         
         return output_path
     
+    def get_cached_pdf(self, db: Session, report_id: int) -> Path:
+        """
+        Return the PDF for the report's current content
+        
+        PDFs are cached by report content fingerprint, so the (slow)
+        WeasyPrint render only runs when the report actually changed.
+        
+        Args:
+            db: Database session
+            report_id: Report ID
+            
+        Returns:
+            Path to the cached PDF file
+            
+        Raises:
+            ValueError: If report not found or generation fails
+        """
+        report = db.query(Report).filter(Report.id == report_id).first()
+        if not report:
+            raise ValueError(f"Report with id {report_id} not found")
+        
+        key = f"report_{report_id}_{report_fingerprint(db, report)}"
+        cached_path = self.pdf_cache.get(key)
+        if cached_path:
+            logger.info(f"Serving cached PDF for report {report_id}")
+            return cached_path
+        
+        tmp_path = self.generate_pdf(db, report_id, output_path=self.pdf_cache.temp_path_for(key))
+        return self.pdf_cache.put_file(key, tmp_path)
+    
     def generate_html_preview(
         self,
         db: Session,
@@ -0,0 +1,135 @@
+"""
+Draft Pre-generation Service for ReportForge
+
+Creating the monthly report at the start of the month is slow when done
+interactively: every snapshot is built on demand, then the executive
+summary is calculated and the first PDF rendered. This service does all of
+that ahead of time (see app/pregenerate.py, meant to be run by cron
+off-peak), so users open a draft that is ready immediately.
+
+Pre-generation is idempotent: if a report for the period already exists it
+is left alone, so the job can safely be rerun (the rerun still warms the
+PDF cache of an existing draft, retrying a render that failed).
+"""
+
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+
+from sqlalchemy.orm import Session
+
+from app.models.project import Project, ProjectStatus
+from app.models.report import Report, ReportExecutiveSummary, ReportStatus, ReportTemplate
+from app.services.snapshot_service import SnapshotService
+from app.services.summary_service import sum_totals
+
+logger = logging.getLogger(__name__)
+
+# Projects in these states are not part of a new monthly report
+INACTIVE_STATUSES = (ProjectStatus.COMPLETED, ProjectStatus.ARCHIVED)
+
+MONTH_NAMES = (
+    "Gennaio", "Febbraio", "Marzo", "Aprile", "Maggio", "Giugno",
+    "Luglio", "Agosto", "Settembre", "Ottobre", "Novembre", "Dicembre"
+)
+
+
+def month_period(year: int, month: int) -> Tuple[date, date]:
+    """First and last day of a month"""
+    start = date(year, month, 1)
+    next_start = date(year + month // 12, month % 12 + 1, 1)
+    return start, next_start - timedelta(days=1)
+
+
+def next_period(today: Optional[date] = None) -> Tuple[date, date]:
+    """The calendar month after today"""
+    today = today or date.today()
+    return month_period(today.year + today.month // 12, today.month % 12 + 1)
+
+
+class DraftPregenerationService:
+    """Creates next period's draft report ahead of time"""
+
+    def resolve_template(self, db: Session, template_id: Optional[int] = None) -> Optional[ReportTemplate]:
+        """
+        The template to use: the given one, else the default, else none
+
+        Raises:
+            ValueError: If template_id does not exist
+        """
+        if template_id is not None:
+            template = db.query(ReportTemplate).filter(ReportTemplate.id == template_id).first()
+            if not template:
+                raise ValueError(f"Template with id {template_id} not found")
+            return template
+
+        return db.query(ReportTemplate).order_by(
+            ReportTemplate.is_default.desc(), ReportTemplate.id
+        ).first()
+
+    def active_project_ids(self, db: Session) -> List[int]:
+        """IDs of projects to include in a new report"""
+        rows = db.query(Project.id).filter(
+            Project.status.notin_(INACTIVE_STATUSES)
+        ).order_by(Project.id).all()
+        return [row.id for row in rows]
+
+    def existing_report(self, db: Session, period_start: date, period_end: date) -> Optional[Report]:
+        """The (first) report already covering a period, if any"""
+        return db.query(Report).filter(
+            Report.period_start == period_start,
+            Report.period_end == period_end
+        ).order_by(Report.id).first()
+
+    def create_draft(
+        self,
+        db: Session,
+        period_start: date,
+        period_end: date,
+        template_id: Optional[int] = None
+    ) -> Optional[Report]:
+        """
+        Create a draft report for a period with snapshots of all active projects
+        and its executive summary (does not commit)
+
+        Args:
+            db: Database session
+            period_start: First day of the period
+            period_end: Last day of the period
+            template_id: Template to use (default template if omitted)
+
+        Returns:
+            The new Report, or None if a report for the period already exists
+        """
+        existing = self.existing_report(db, period_start, period_end)
+        if existing:
+            logger.info(f"Report {existing.id} already covers {period_start} - {period_end}, skipping")
+            return None
+
+        template = self.resolve_template(db, template_id)
+        template_config: Dict[str, Any] = template.config if template else {}
+
+        report = Report(
+            name=f"Report {MONTH_NAMES[period_start.month - 1]} {period_start.year}",
+            period_start=period_start,
+            period_end=period_end,
+            status=ReportStatus.DRAFT,
+            template_config=template_config
+        )
+        db.add(report)
+        db.flush()
+
+        project_ids = self.active_project_ids(db)
+        rows = SnapshotService().create_snapshots(db, report.id, project_ids) if project_ids else []
+
+        revenue, saving = sum_totals(row["financial_data"] for row in rows)
+        db.add(ReportExecutiveSummary(
+            report_id=report.id,
+            actual_revenue_total=revenue,
+            actual_saving_total=saving,
+            actual_projects_count=len(rows)
+        ))
+        db.flush()
+
+        logger.info(f"Pre-generated draft report {report.id} with {len(rows)} projects")
+        return report
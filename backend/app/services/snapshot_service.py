@@ -0,0 +1,369 @@
+"""
+Snapshot Service for ReportForge
+
+Builds report project snapshots from live project data.
+
+Snapshots are built set-based: all selected projects and their children are
+loaded with a fixed number of eager-load queries, financial totals are read
+from the precomputed project_financial_summary rows in one query, and the
+snapshot rows are written with a single bulk INSERT, so the cost of creating
+a report grows neither with round trips per project nor with the number of
+revenue, subscription and cost rows behind each project.
+"""
+
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Dict, Any, List, Optional, Sequence
+import logging
+
+from sqlalchemy import insert, update
+from sqlalchemy.orm import Session, selectinload, joinedload
+
+from app.models.project import Project, ProjectClient, ProjectStakeholder, ProjectTeam
+from app.models.report import ReportProjectSnapshot
+from app.services.financial_summary_service import load_summaries, to_financial_data
+from app.services.summary_service import apply_summary_delta, snapshot_totals
+
+logger = logging.getLogger(__name__)
+
+# Snapshot fields copied back to the linked project when edited
+PROJECT_SYNC_FIELDS = ('name', 'description', 'status', 'start_date', 'end_date')
+
+# Snapshot fields derived from the project (notes, custom_fields and
+# sort_order are owned by the report and never refreshed)
+REFRESHABLE_FIELDS = (
+    'name', 'project_type', 'status', 'description', 'start_date', 'end_date',
+    'financial_data', 'team_data', 'stakeholder_data', 'client_data', 'activities_data'
+)
+
+REFRESH_POLICIES = ('overwrite', 'fill_missing')
+
+
+def _enum_value(value: Any) -> Any:
+    return value.value if isinstance(value, Enum) else value
+
+
+def _isoformat(value: Any) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+class SnapshotService:
+    """Builds and bulk-inserts report project snapshots"""
+
+    def load_projects(self, db: Session, project_ids: Sequence[int]) -> Dict[int, Project]:
+        """
+        Load projects with every child collection used by a snapshot
+
+        Args:
+            db: Database session
+            project_ids: Project IDs (duplicates and unknown IDs are fine)
+
+        Returns:
+            Dictionary of project ID -> Project
+        """
+        if not project_ids:
+            return {}
+
+        projects = db.query(Project).filter(
+            Project.id.in_(set(project_ids))
+        ).options(
+            selectinload(Project.activities),
+            selectinload(Project.team).joinedload(ProjectTeam.team_member),
+            selectinload(Project.stakeholders).joinedload(ProjectStakeholder.stakeholder),
+            selectinload(Project.clients).joinedload(ProjectClient.client),
+        ).all()
+
+        return {project.id: project for project in projects}
+
+    def financial_rollups(self, db: Session, project_ids: Sequence[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        financial_data for many projects in one query
+
+        Totals are read from project_financial_summary (one row per
+        project, kept current on every revenue, subscription and cost
+        write), so no revenue, subscription or cost row is summed here.
+
+        Args:
+            db: Database session
+            project_ids: Project IDs
+
+        Returns:
+            Dictionary of project ID -> financial_data (projects without
+            any financial rows get zero totals)
+        """
+        summaries = load_summaries(db, project_ids)
+        return {project_id: to_financial_data(summaries.get(project_id)) for project_id in set(project_ids)}
+
+    def snapshot_values(
+        self,
+        report_id: int,
+        project: Project,
+        sort_order: int,
+        financial_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Column values of a snapshot of a loaded project
+
+        Args:
+            report_id: Report the snapshot belongs to
+            project: Project loaded with load_projects()
+            sort_order: Position of the project in the report
+            financial_data: Rollups from financial_rollups()
+
+        Returns:
+            Dictionary of ReportProjectSnapshot column -> value
+        """
+        return {
+            "report_id": report_id,
+            "project_id": project.id,
+            "sort_order": sort_order,
+            "name": project.name,
+            "project_type": _enum_value(project.project_type),
+            "status": _enum_value(project.status),
+            "description": project.description,
+            "start_date": project.start_date,
+            "end_date": project.end_date,
+            "financial_data": financial_data,
+            "team_data": [
+                {"name": pt.team_member.full_name, "role": pt.role_in_project or pt.team_member.role}
+                for pt in project.team
+            ],
+            "stakeholder_data": [
+                {"name": ps.stakeholder.name, "role": ps.role}
+                for ps in project.stakeholders
+            ],
+            "client_data": [{"name": pc.client.name} for pc in project.clients],
+            "activities_data": [
+                {
+                    "name": a.title,
+                    "status": _enum_value(a.status),
+                    "start_date": _isoformat(a.start_date),
+                    "end_date": _isoformat(a.end_date)
+                }
+                for a in project.activities
+            ],
+        }
+
+    def build_snapshot(self, db: Session, report_id: int, project_id: int, sort_order: int) -> Optional[ReportProjectSnapshot]:
+        """Build (but do not add) a single snapshot; None if the project does not exist"""
+        project = self.load_projects(db, [project_id]).get(project_id)
+        if not project:
+            return None
+        financial_data = self.financial_rollups(db, [project_id])[project_id]
+        return ReportProjectSnapshot(**self.snapshot_values(report_id, project, sort_order, financial_data))
+
+    def create_snapshots(
+        self,
+        db: Session,
+        report_id: int,
+        project_ids: Sequence[int],
+        start_order: int = 0
+    ) -> List[Dict[str, Any]]:
+        """
+        Snapshot projects into a report with one bulk INSERT
+
+        Projects keep the order of project_ids (sort_order = start_order +
+        position); unknown IDs are skipped. Does not commit.
+
+        Args:
+            db: Database session
+            report_id: Target report
+            project_ids: Projects to snapshot
+            start_order: sort_order of the first project
+
+        Returns:
+            List of inserted snapshot values
+        """
+        projects = self.load_projects(db, project_ids)
+        rollups = self.financial_rollups(db, list(projects))
+        rows = [
+            self.snapshot_values(report_id, projects[project_id], start_order + index, rollups[project_id])
+            for index, project_id in enumerate(project_ids)
+            if project_id in projects
+        ]
+
+        if rows:
+            db.execute(insert(ReportProjectSnapshot), rows)
+            logger.info(f"Created {len(rows)} snapshots for report {report_id}")
+
+        return rows
+
+    def refresh(
+        self,
+        db: Session,
+        report_id: int,
+        snapshot_ids: Optional[Sequence[int]] = None,
+        fields: Optional[Sequence[str]] = None,
+        policy: str = 'overwrite'
+    ) -> Dict[str, Any]:
+        """
+        Re-derive snapshots from their source projects
+
+        Sources are loaded set-based (load_projects + financial_rollups) and
+        only snapshots whose values actually differ are written, through
+        bulk_update() so the executive summary stays consistent. Does not
+        commit.
+
+        Args:
+            db: Database session
+            report_id: Report to refresh
+            snapshot_ids: Snapshots to refresh (None = all of the report)
+            fields: Fields to refresh (None = REFRESHABLE_FIELDS)
+            policy: 'overwrite' replaces values; 'fill_missing' only fills
+                fields that are empty in the snapshot, keeping user edits
+
+        Returns:
+            Dictionary with updated_ids, unchanged_count and
+            orphaned_snapshot_ids (snapshots with no source project, e.g.
+            because it was deleted; they are left untouched)
+
+        Raises:
+            ValueError: On unknown fields or policy
+        """
+        fields = tuple(fields) if fields else REFRESHABLE_FIELDS
+        unknown = [field for field in fields if field not in REFRESHABLE_FIELDS]
+        if unknown:
+            raise ValueError(f"Fields cannot be refreshed: {unknown}")
+        if policy not in REFRESH_POLICIES:
+            raise ValueError(f"Unknown merge policy: {policy}")
+
+        query = db.query(
+            ReportProjectSnapshot.id,
+            ReportProjectSnapshot.project_id,
+            ReportProjectSnapshot.sort_order,
+            *[getattr(ReportProjectSnapshot, field) for field in fields]
+        ).filter(
+            ReportProjectSnapshot.report_id == report_id
+        )
+        if snapshot_ids is not None:
+            query = query.filter(ReportProjectSnapshot.id.in_(snapshot_ids))
+        snapshots = query.all()
+
+        project_ids = {snapshot.project_id for snapshot in snapshots if snapshot.project_id is not None}
+        projects = self.load_projects(db, project_ids)
+        rollups = self.financial_rollups(db, list(projects))
+
+        changes = []
+        orphaned_snapshot_ids = []
+        for snapshot in snapshots:
+            project = projects.get(snapshot.project_id)
+            if not project:
+                orphaned_snapshot_ids.append(snapshot.id)
+                continue
+
+            fresh = self.snapshot_values(report_id, project, snapshot.sort_order, rollups[project.id])
+            change = {}
+            for field in fields:
+                current = getattr(snapshot, field)
+                if policy == 'fill_missing' and current not in (None, '', {}, []):
+                    continue
+                if fresh[field] != current:
+                    change[field] = fresh[field]
+            if change:
+                changes.append({'id': snapshot.id, **change})
+
+        self.bulk_update(db, report_id, changes, sync_projects=False)
+        unchanged_count = len(snapshots) - len(changes) - len(orphaned_snapshot_ids)
+        logger.info(
+            f"Refreshed report {report_id} ({policy}): {len(changes)} changed, "
+            f"{unchanged_count} unchanged, {len(orphaned_snapshot_ids)} orphaned"
+        )
+
+        return {
+            'updated_ids': [change['id'] for change in changes],
+            'unchanged_count': unchanged_count,
+            'orphaned_snapshot_ids': orphaned_snapshot_ids
+        }
+
+    def bulk_update(
+        self,
+        db: Session,
+        report_id: int,
+        changes: Sequence[Dict[str, Any]],
+        sync_projects: bool = True
+    ) -> List[int]:
+        """
+        Apply many snapshot edits with batched UPDATEs
+
+        Snapshots are updated with one ORM bulk UPDATE by primary key
+        (executemany, batched by the set of changed fields), the executive
+        summary receives a single combined delta, and edits to basic fields
+        are copied back to the linked projects with one more bulk UPDATE.
+        Does not commit, so the caller applies everything in one transaction.
+
+        Args:
+            db: Database session
+            report_id: Report the snapshots belong to
+            changes: Dicts with the snapshot 'id' and the fields to change
+            sync_projects: Copy PROJECT_SYNC_FIELDS back to linked projects
+
+        Returns:
+            IDs of the updated snapshots
+
+        Raises:
+            ValueError: If an ID is repeated or not a snapshot of the report
+        """
+        ids = [change['id'] for change in changes]
+        if len(set(ids)) != len(ids):
+            raise ValueError("Duplicate snapshot id in bulk update")
+        if not ids:
+            return []
+
+        current = {
+            row.id: row for row in db.query(
+                ReportProjectSnapshot.id,
+                ReportProjectSnapshot.project_id,
+                ReportProjectSnapshot.financial_data
+            ).filter(
+                ReportProjectSnapshot.report_id == report_id,
+                ReportProjectSnapshot.id.in_(ids)
+            )
+        }
+        missing = [snapshot_id for snapshot_id in ids if snapshot_id not in current]
+        if missing:
+            raise ValueError(f"Snapshots not found in report: {missing}")
+
+        now = datetime.now(timezone.utc)
+        db.execute(
+            update(ReportProjectSnapshot).execution_options(synchronize_session=False),
+            [{**change, 'updated_at': now} for change in changes]
+        )
+
+        # One combined summary delta for all financial edits
+        revenue_delta = saving_delta = 0
+        for change in changes:
+            if 'financial_data' in change:
+                old_revenue, old_saving = snapshot_totals(current[change['id']].financial_data)
+                new_revenue, new_saving = snapshot_totals(change['financial_data'])
+                revenue_delta += new_revenue - old_revenue
+                saving_delta += new_saving - old_saving
+        apply_summary_delta(db, report_id, revenue_delta, saving_delta)
+
+        if sync_projects:
+            self._sync_projects(db, [
+                change['id'] for change in changes
+                if current[change['id']].project_id and any(field in change for field in PROJECT_SYNC_FIELDS)
+            ])
+
+        logger.info(f"Bulk updated {len(ids)} snapshots of report {report_id}")
+        return ids
+
+    def _sync_projects(self, db: Session, snapshot_ids: Sequence[int]) -> None:
+        """Copy PROJECT_SYNC_FIELDS of snapshots back to their projects"""
+        if not snapshot_ids:
+            return
+
+        columns = [getattr(ReportProjectSnapshot, field) for field in PROJECT_SYNC_FIELDS]
+        rows = db.query(ReportProjectSnapshot.project_id, *columns).filter(
+            ReportProjectSnapshot.id.in_(snapshot_ids)
+        ).all()
+
+        # A project edited through several snapshots gets the last one
+        values = {
+            row.project_id: {'id': row.project_id, **{field: getattr(row, field) for field in PROJECT_SYNC_FIELDS}}
+            for row in rows
+        }
+        db.execute(
+            update(Project).execution_options(synchronize_session=False),
+            [{**value, 'updated_at': datetime.now(timezone.utc)} for value in values.values()]
+        )
@@ -0,0 +1,222 @@
+"""
+Executive Summary Service for ReportForge
+
+Keeps the ACTUAL totals of ReportExecutiveSummary (revenue, saving, project
+count) up to date incrementally: every snapshot insert, update and delete
+applies the difference it makes to the totals in the same transaction, so
+reading a summary never requires a pass over the report's snapshots.
+
+A full recompute from the snapshots remains available as a consistency check
+and to repair summaries created before incremental maintenance.
+"""
+
+from decimal import Decimal
+from typing import Dict, Any, Iterable, Optional, Tuple
+import logging
+import re
+
+from sqlalchemy import Numeric, case, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.models.report import ReportProjectSnapshot, ReportExecutiveSummary
+
+logger = logging.getLogger(__name__)
+
+ZERO = Decimal("0.00")
+CENT = Decimal("0.01")
+
+Totals = Tuple[Decimal, Decimal]
+
+# Amounts are JSON numbers or strings holding a plain decimal number; anything
+# else ('', 'n/a', booleans, null) counts as 0. The SQL recompute applies the
+# same rule, so both paths agree and bad data cannot abort a recompute.
+AMOUNT_PATTERN = r"^\s*[-+]?([0-9]+(\.[0-9]*)?|\.[0-9]+)([eE][-+]?[0-9]+)?\s*$"
+_amount_re = re.compile(AMOUNT_PATTERN)
+
+
+def parse_amount(value: Any) -> Optional[Decimal]:
+    """A financial_data value as a Decimal, or None if it is not an amount"""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return Decimal(str(value))
+    if isinstance(value, str) and _amount_re.match(value):
+        return Decimal(value.strip())
+    return None
+
+
+def _amount(financial_data: Dict[str, Any], key: str) -> Decimal:
+    amount = parse_amount(financial_data.get(key))
+    return ZERO if amount is None else amount
+
+
+def snapshot_totals(financial_data: Optional[Dict[str, Any]]) -> Totals:
+    """
+    Revenue and saving contributed by one snapshot
+
+    Args:
+        financial_data: Snapshot financial_data (may be None)
+
+    Returns:
+        Tuple of (revenue, saving)
+    """
+    if not financial_data:
+        return ZERO, ZERO
+    revenue = _amount(financial_data, "revenue_capex") + _amount(financial_data, "revenue_subscription")
+    saving = _amount(financial_data, "saving_capex") + _amount(financial_data, "saving_subscription")
+    return revenue, saving
+
+
+def sum_totals(financial_data_items: Iterable[Optional[Dict[str, Any]]]) -> Totals:
+    """Combined snapshot_totals() of several snapshots"""
+    revenue, saving = ZERO, ZERO
+    for financial_data in financial_data_items:
+        item_revenue, item_saving = snapshot_totals(financial_data)
+        revenue += item_revenue
+        saving += item_saving
+    return revenue, saving
+
+
+def apply_summary_delta(
+    db: Session,
+    report_id: int,
+    revenue: Decimal = ZERO,
+    saving: Decimal = ZERO,
+    projects_count: int = 0
+) -> None:
+    """
+    Add a delta to a report's ACTUAL totals
+
+    Runs as a single atomic upsert (the summary row is created if missing),
+    so concurrent edits to the same report cannot lose updates. Does not
+    commit: the delta belongs to the caller's transaction.
+
+    Args:
+        db: Database session
+        report_id: Report whose summary changes
+        revenue: Revenue to add (negative to subtract)
+        saving: Saving to add (negative to subtract)
+        projects_count: Projects to add (negative to subtract)
+    """
+    if not (revenue or saving or projects_count):
+        return
+
+    table = ReportExecutiveSummary.__table__
+    statement = insert(table).values(
+        report_id=report_id,
+        actual_revenue_total=revenue,
+        actual_saving_total=saving,
+        actual_projects_count=projects_count
+    )
+    statement = statement.on_conflict_do_update(
+        index_elements=[table.c.report_id],
+        set_={
+            'actual_revenue_total': func.coalesce(table.c.actual_revenue_total, 0) + statement.excluded.actual_revenue_total,
+            'actual_saving_total': func.coalesce(table.c.actual_saving_total, 0) + statement.excluded.actual_saving_total,
+            'actual_projects_count': func.coalesce(table.c.actual_projects_count, 0) + statement.excluded.actual_projects_count,
+            'updated_at': func.now()
+        }
+    )
+    db.execute(statement)
+
+
+def apply_snapshot_change(
+    db: Session,
+    report_id: int,
+    old_financial_data: Optional[Dict[str, Any]],
+    new_financial_data: Optional[Dict[str, Any]],
+    projects_count: int = 0
+) -> None:
+    """
+    Apply the summary delta of a snapshot insert, update or delete
+
+    Pass None as old_financial_data for an insert and as
+    new_financial_data for a delete (with projects_count +1 / -1).
+    """
+    old_revenue, old_saving = snapshot_totals(old_financial_data)
+    new_revenue, new_saving = snapshot_totals(new_financial_data)
+    apply_summary_delta(db, report_id, new_revenue - old_revenue, new_saving - old_saving, projects_count)
+
+
+class SummaryService:
+    """Full recompute and consistency check of executive summary totals"""
+
+    def compute_totals(self, db: Session, report_id: int) -> Dict[str, Any]:
+        """
+        Compute the ACTUAL totals from the report's snapshots
+
+        Runs as a single aggregate over the financial_data JSONB keys, so no
+        snapshot is loaded into Python.
+
+        Returns:
+            Dictionary with actual_revenue_total, actual_saving_total and actual_projects_count
+        """
+        financial_data = ReportProjectSnapshot.financial_data
+
+        def amount(key: str):
+            value = financial_data[key]
+            return case(
+                (func.jsonb_typeof(value) == 'number', value.astext.cast(Numeric)),
+                (
+                    (func.jsonb_typeof(value) == 'string') & value.astext.regexp_match(AMOUNT_PATTERN),
+                    value.astext.cast(Numeric)
+                ),
+                else_=0
+            )
+
+        def total(*keys: str):
+            amounts = [amount(key) for key in keys]
+            return func.coalesce(func.sum(sum(amounts[1:], amounts[0])), 0)
+
+        revenue, saving, projects_count = db.query(
+            total("revenue_capex", "revenue_subscription"),
+            total("saving_capex", "saving_subscription"),
+            func.count(ReportProjectSnapshot.id)
+        ).filter(
+            ReportProjectSnapshot.report_id == report_id
+        ).one()
+
+        return {
+            'actual_revenue_total': Decimal(revenue).quantize(CENT),
+            'actual_saving_total': Decimal(saving).quantize(CENT),
+            'actual_projects_count': projects_count
+        }
+
+    def recompute(self, db: Session, report_id: int) -> ReportExecutiveSummary:
+        """Overwrite the ACTUAL totals with a full recompute (does not commit)"""
+        summary = db.query(ReportExecutiveSummary).filter(
+            ReportExecutiveSummary.report_id == report_id
+        ).first()
+        if not summary:
+            summary = ReportExecutiveSummary(report_id=report_id)
+            db.add(summary)
+
+        for field, value in self.compute_totals(db, report_id).items():
+            setattr(summary, field, value)
+
+        db.flush()
+        return summary
+
+    def check(self, db: Session, report_id: int) -> Dict[str, Any]:
+        """
+        Compare the stored ACTUAL totals with a full recompute
+
+        Returns:
+            Dictionary with stored, computed and consistent
+        """
+        summary = db.query(ReportExecutiveSummary).filter(
+            ReportExecutiveSummary.report_id == report_id
+        ).first()
+        computed = self.compute_totals(db, report_id)
+        stored = {
+            field: getattr(summary, field) if summary else None
+            for field in computed
+        }
+
+        consistent = all(
+            stored[field] is not None and stored[field] == value
+            for field, value in computed.items()
+        )
+        if not consistent:
+            logger.warning(f"Executive summary of report {report_id} is out of date: {stored} != {computed}")
+
+        return {'stored': stored, 'computed': computed, 'consistent': consistent}
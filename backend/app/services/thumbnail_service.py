@@ -0,0 +1,155 @@
+"""
+Thumbnail Service for ReportForge
+
+Rasterizes the cover and first content page of a report's cached PDF into
+small PNG previews for the report list.
+
+Images are stored content-addressed (file name = SHA-256 of the PNG), so
+their URLs never change meaning and can be cached forever by browsers. A
+small per-report index maps the report content fingerprint to the current
+image digests; thumbnails are only regenerated when that fingerprint
+changes, and regeneration runs in the background.
+"""
+
+import hashlib
+import io
+import threading
+from typing import Dict, Optional, Tuple
+import logging
+
+import orjson
+import pypdfium2 as pdfium
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models.report import Report
+from app.services.cache import FileCache, report_fingerprint
+
+logger = logging.getLogger(__name__)
+
+# Page name -> zero-based page index in the PDF
+PAGES = {
+    'cover': 0,
+    'first': 1,
+}
+
+# Target thumbnail width in pixels (A4 is 595pt wide)
+THUMBNAIL_WIDTH = 240
+
+_images = FileCache("thumbnails", suffix=".png")
+_index = FileCache("thumbnail_index", suffix=".json")
+
+_in_flight = set()
+_in_flight_lock = threading.Lock()
+
+
+def image_path(digest: str):
+    """Path of a stored thumbnail by digest (None if missing)"""
+    return _images.get(digest)
+
+
+def rasterize(pdf_bytes: bytes) -> Dict[str, bytes]:
+    """
+    Render the thumbnail pages of a PDF as PNG
+
+    Args:
+        pdf_bytes: PDF document
+
+    Returns:
+        Dictionary of page name -> PNG bytes (pages past the end fall back to the last page)
+    """
+    document = pdfium.PdfDocument(pdf_bytes)
+    try:
+        images = {}
+        for name, index in PAGES.items():
+            page = document[min(index, len(document) - 1)]
+            scale = THUMBNAIL_WIDTH / page.get_width()
+            bitmap = page.render(scale=scale)
+            buffer = io.BytesIO()
+            bitmap.to_pil().save(buffer, format="PNG", optimize=True)
+            images[name] = buffer.getvalue()
+        return images
+    finally:
+        document.close()
+
+
+class ThumbnailService:
+    """Looks up and regenerates report thumbnails"""
+
+    def _read_index(self, report_id: int) -> Optional[Dict]:
+        path = _index.get(f"report_{report_id}")
+        return orjson.loads(path.read_bytes()) if path else None
+
+    def lookup(self, db: Session, report: Report, page: str) -> Tuple[Optional[str], bool]:
+        """
+        Find the thumbnail digest for a report page
+
+        Args:
+            db: Database session
+            report: Report
+            page: Page name (see PAGES)
+
+        Returns:
+            Tuple of (digest or None, is_fresh). A stale digest belongs to an
+            older version of the report and should be refreshed.
+        """
+        index = self._read_index(report.id)
+        if not index:
+            return None, False
+        digest = index['pages'].get(page)
+        if digest is None or image_path(digest) is None:
+            return None, False
+        return digest, index['fingerprint'] == report_fingerprint(db, report)
+
+    def discard(self, report_id: int) -> None:
+        """Delete a report's thumbnail index and the images it points to"""
+        index = self._read_index(report_id)
+        if not index:
+            return
+        for digest in index['pages'].values():
+            _images.discard(digest)
+        _index.discard(f"report_{report_id}")
+
+    def regenerate(self, report_id: int) -> None:
+        """
+        Rebuild thumbnails for a report if its content changed
+
+        Meant to run as a background task: uses its own session and skips
+        work already in progress for the same report.
+        """
+        with _in_flight_lock:
+            if report_id in _in_flight:
+                return
+            _in_flight.add(report_id)
+
+        db = SessionLocal()
+        try:
+            report = db.query(Report).filter(Report.id == report_id).first()
+            if not report:
+                return
+
+            fingerprint = report_fingerprint(db, report)
+            index = self._read_index(report_id)
+            if index and index['fingerprint'] == fingerprint:
+                return
+
+            from app.services.pdf_service import PDFGenerationService
+
+            pdf_path = PDFGenerationService().get_cached_pdf(db, report_id)
+            pages = {}
+            for name, png in rasterize(pdf_path.read_bytes()).items():
+                digest = hashlib.sha256(png).hexdigest()
+                if image_path(digest) is None:
+                    _images.put(digest, png)
+                pages[name] = digest
+
+            _index.put(f"report_{report_id}", orjson.dumps({'fingerprint': fingerprint, 'pages': pages}))
+            logger.info(f"Thumbnails regenerated for report {report_id}")
+
+        except Exception as e:
+            logger.error(f"Thumbnail generation failed for report {report_id}: {e}")
+
+        finally:
+            db.close()
+            with _in_flight_lock:
+                _in_flight.discard(report_id)
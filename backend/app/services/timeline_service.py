@@ -0,0 +1,222 @@
+"""
+Timeline Service for ReportForge
+
+Renders Gantt-style SVG timelines for the PDF templates: one per project
+(its activities) and one for the whole portfolio (the projects).
+
+Overlapping bars are packed into as few lanes as possible with the classic
+interval-partitioning sweep (sort by start, min-heap of lane end dates),
+which is O(n log n). Rendered timelines are memoized per snapshot version,
+so unchanged snapshots are never laid out twice.
+"""
+
+import heapq
+from datetime import date
+from html import escape
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+import logging
+
+from app.models.report import ReportProjectSnapshot
+from app.services.cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+STATUS_COLORS = {
+    'PLANNED': '#8fb8de',
+    'IN_PROGRESS': '#0072CE',
+    'COMPLETED': '#28a745',
+    'CANCELLED': '#dc3545',
+}
+DEFAULT_COLOR = '#005a9e'
+TEXT_COLOR = '#333'
+MUTED_COLOR = '#666'
+GRID_COLOR = '#ddd'
+
+MONTH_LABELS = ('Gen', 'Feb', 'Mar', 'Apr', 'Mag', 'Giu', 'Lug', 'Ago', 'Set', 'Ott', 'Nov', 'Dic')
+
+WIDTH = 640
+AXIS_HEIGHT = 20
+LANE_HEIGHT = 18
+
+_timeline_cache = LRUCache(maxsize=1024)
+
+Interval = Tuple[date, date]
+
+
+def _parse_date(value: Any) -> Optional[date]:
+    if value is None or isinstance(value, date):
+        return value
+    try:
+        return date.fromisoformat(str(value)[:10])
+    except ValueError:
+        return None
+
+
+def _interval(start: Any, end: Any) -> Optional[Interval]:
+    """Normalize a (start, end) pair; one-sided dates become milestones"""
+    start, end = _parse_date(start), _parse_date(end)
+    start = start or end
+    end = end or start
+    if start is None:
+        return None
+    return (start, end) if start <= end else (end, start)
+
+
+def pack_lanes(intervals: Sequence[Interval]) -> Tuple[List[int], int]:
+    """
+    Assign each interval to a lane so that no two intervals in a lane overlap
+
+    Args:
+        intervals: (start, end) pairs, inclusive on both ends
+
+    Returns:
+        Tuple of (lane index per interval, number of lanes used)
+    """
+    order = sorted(range(len(intervals)), key=lambda i: intervals[i])
+    lanes = [0] * len(intervals)
+    free_at: List[Tuple[date, int]] = []  # (end of last bar, lane)
+    lane_count = 0
+
+    for i in order:
+        start, end = intervals[i]
+        if free_at and free_at[0][0] < start:
+            _, lane = heapq.heappop(free_at)
+        else:
+            lane = lane_count
+            lane_count += 1
+        lanes[i] = lane
+        heapq.heappush(free_at, (end, lane))
+
+    return lanes, lane_count
+
+
+def layout_timeline(items: Sequence[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Compute the lane layout for timeline items
+
+    Args:
+        items: Dicts with label, status, start and end
+
+    Returns:
+        Dictionary with start, end, lane_count and bars, or None if no item has dates
+    """
+    bars = []
+    intervals = []
+    for item in items:
+        interval = _interval(item.get('start'), item.get('end'))
+        if interval:
+            bars.append({'label': item.get('label') or '', 'status': item.get('status')})
+            intervals.append(interval)
+
+    if not bars:
+        return None
+
+    lanes, lane_count = pack_lanes(intervals)
+    for bar, (start, end), lane in zip(bars, intervals, lanes):
+        bar.update(start=start, end=end, lane=lane)
+
+    return {
+        'start': min(start for start, _ in intervals),
+        'end': max(end for _, end in intervals),
+        'lane_count': lane_count,
+        'bars': bars,
+    }
+
+
+def _month_ticks(start: date, end: date) -> List[date]:
+    """First day of each month in range, thinned out for long spans"""
+    months = (end.year - start.year) * 12 + end.month - start.month + 1
+    step = 1 if months <= 12 else 3 if months <= 36 else 12
+    ticks = []
+    index = start.year * 12 + start.month - 1
+    last = end.year * 12 + end.month - 1
+    index -= index % step
+    while index <= last:
+        tick = date(index // 12, index % 12 + 1, 1)
+        if tick >= start:
+            ticks.append(tick)
+        index += step
+    return ticks
+
+
+def render_timeline(layout: Dict[str, Any]) -> str:
+    """Render a computed layout as SVG"""
+    start, end = layout['start'], layout['end']
+    span = max((end - start).days + 1, 1)
+    height = AXIS_HEIGHT + LANE_HEIGHT * layout['lane_count'] + 4
+
+    def x(day: date) -> float:
+        return WIDTH * (day - start).days / span
+
+    body = []
+    for tick in _month_ticks(start, end):
+        label = MONTH_LABELS[tick.month - 1] + (f" {tick.year % 100:02d}" if tick.month == 1 or tick == start else '')
+        body.append(f'<line x1="{x(tick):.1f}" y1="{AXIS_HEIGHT - 6}" x2="{x(tick):.1f}" y2="{height}" stroke="{GRID_COLOR}" stroke-width="0.5"/>')
+        body.append(f'<text x="{x(tick) + 2:.1f}" y="{AXIS_HEIGHT - 9}" fill="{MUTED_COLOR}">{label}</text>')
+
+    for bar in layout['bars']:
+        bar_x = x(bar['start'])
+        bar_w = max(WIDTH * ((bar['end'] - bar['start']).days + 1) / span, 3)
+        y = AXIS_HEIGHT + bar['lane'] * LANE_HEIGHT
+        color = STATUS_COLORS.get(str(bar['status']), DEFAULT_COLOR)
+        body.append(f'<rect x="{bar_x:.1f}" y="{y + 2}" width="{bar_w:.1f}" height="{LANE_HEIGHT - 4}" fill="{color}" rx="2"/>')
+
+        # Label inside the bar when it fits, otherwise right after it
+        max_chars = int(bar_w / 5)
+        label = bar['label']
+        if len(label) <= max_chars:
+            body.append(f'<text x="{bar_x + 3:.1f}" y="{y + 12}" fill="white">{escape(label)}</text>')
+        elif bar_x + bar_w + 60 < WIDTH:
+            body.append(f'<text x="{bar_x + bar_w + 3:.1f}" y="{y + 12}" fill="{TEXT_COLOR}">{escape(label[:30])}</text>')
+
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {WIDTH} {height}" width="100%" '
+        f'font-family="Helvetica, Arial, sans-serif" font-size="8">' + ''.join(body) + '</svg>'
+    )
+
+
+def _snapshot_version(snapshot: ReportProjectSnapshot) -> Tuple[int, Any]:
+    return (snapshot.id, snapshot.updated_at or snapshot.created_at)
+
+
+class TimelineService:
+    """Builds memoized project and portfolio timelines from snapshots"""
+
+    def project_timeline(self, snapshot: ReportProjectSnapshot) -> Optional[str]:
+        """SVG timeline of a project's activities (None if no activity has dates)"""
+        def build() -> str:
+            items = [
+                {
+                    'label': activity.get('title') or activity.get('name'),
+                    'status': activity.get('status'),
+                    'start': activity.get('start_date'),
+                    'end': activity.get('end_date'),
+                }
+                for activity in (snapshot.activities_data or [])
+            ]
+            layout = layout_timeline(items)
+            return render_timeline(layout) if layout else ''
+
+        svg = _timeline_cache.get_or_set(('project',) + _snapshot_version(snapshot), build)
+        return svg or None
+
+    def portfolio_timeline(self, snapshots: Sequence[ReportProjectSnapshot]) -> Optional[str]:
+        """SVG timeline of all projects in a report (None if no project has dates)"""
+        def build() -> str:
+            items = [
+                {
+                    'label': snapshot.name,
+                    'status': None,
+                    'start': snapshot.start_date,
+                    'end': snapshot.end_date,
+                }
+                for snapshot in snapshots
+            ]
+            layout = layout_timeline(items)
+            if layout:
+                logger.info(f"Portfolio timeline: {len(layout['bars'])} projects in {layout['lane_count']} lanes")
+            return render_timeline(layout) if layout else ''
+
+        key = ('portfolio',) + tuple(_snapshot_version(snapshot) for snapshot in snapshots)
+        svg = _timeline_cache.get_or_set(key, build)
+        return svg or None
@@ -0,0 +1,179 @@
+"""
+Version Service for ReportForge
+
+Captures report history in ReportVersion (on finalize and on explicit save).
+
+Storing the whole report on every save would bloat report_versions, so only
+every BASE_INTERVAL-th version holds a full document ("base"); the versions
+in between hold a JSON Patch (RFC 6902) against the previous version
+("delta"). Reconstructing any version loads its base and at most
+BASE_INTERVAL - 1 deltas, so the cost is bounded no matter how long the
+history gets.
+
+Document layout (data_snapshot of a base version):
+    report             - editable report fields
+    executive_summary  - summary totals and notes
+    snapshots          - snapshot columns keyed by snapshot id, so patches
+                         stay small when snapshots are added or reordered
+"""
+
+from typing import Dict, Any, List, Optional
+import logging
+
+import jsonpatch
+import orjson
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.models.report import Report, ReportProjectSnapshot, ReportExecutiveSummary, ReportVersion
+from app.services.export_service import dumps
+
+logger = logging.getLogger(__name__)
+
+# A full document is stored every BASE_INTERVAL versions (1, 11, 21, ...)
+BASE_INTERVAL = 10
+
+_REPORT_FIELDS = ('name', 'description', 'status', 'period_start', 'period_end', 'template_config')
+
+_SUMMARY_FIELDS = (
+    'actual_revenue_total', 'actual_saving_total', 'actual_projects_count',
+    'forecast_revenue_total', 'forecast_saving_total', 'forecast_projects_count', 'notes'
+)
+
+_SNAPSHOT_FIELDS = (
+    'project_id', 'sort_order', 'name', 'project_type', 'status', 'description',
+    'start_date', 'end_date', 'financial_data', 'team_data', 'stakeholder_data',
+    'client_data', 'activities_data', 'notes', 'custom_fields'
+)
+
+
+class VersionNotFoundError(LookupError):
+    """Raised when a report version does not exist"""
+
+
+def _is_base(version_number: int) -> bool:
+    return (version_number - 1) % BASE_INTERVAL == 0
+
+
+class VersionService:
+    """Captures, reconstructs and compares report versions"""
+
+    def build_document(self, db: Session, report: Report) -> Dict[str, Any]:
+        """Current state of a report as a JSON-compatible document"""
+        summary = db.query(ReportExecutiveSummary).filter(
+            ReportExecutiveSummary.report_id == report.id
+        ).first()
+        snapshots = db.query(ReportProjectSnapshot).filter(
+            ReportProjectSnapshot.report_id == report.id
+        ).order_by(ReportProjectSnapshot.sort_order, ReportProjectSnapshot.id)
+
+        document = {
+            'report': {field: getattr(report, field) for field in _REPORT_FIELDS},
+            'executive_summary': {field: getattr(summary, field) for field in _SUMMARY_FIELDS} if summary else None,
+            'snapshots': {
+                str(snapshot.id): {field: getattr(snapshot, field) for field in _SNAPSHOT_FIELDS}
+                for snapshot in snapshots
+            }
+        }
+        # Round-trip through JSON so dates/Decimals compare like stored values
+        return orjson.loads(dumps(document))
+
+    def capture(
+        self,
+        db: Session,
+        report: Report,
+        notes: Optional[str] = None,
+        created_by: Optional[int] = None
+    ) -> ReportVersion:
+        """
+        Record the current state of a report as a new version (does not commit)
+
+        Args:
+            db: Database session
+            report: Report to capture
+            notes: Free-text label (e.g. "Finalized")
+            created_by: User ID
+
+        Returns:
+            The new ReportVersion
+        """
+        # Serialize concurrent captures of the same report
+        db.query(Report.id).filter(Report.id == report.id).with_for_update().one()
+
+        last_number = db.query(func.max(ReportVersion.version_number)).filter(
+            ReportVersion.report_id == report.id
+        ).scalar() or 0
+        version_number = last_number + 1
+        document = self.build_document(db, report)
+
+        if _is_base(version_number):
+            data = {'kind': 'base', 'document': document}
+        else:
+            previous = self.reconstruct(db, report.id, last_number)
+            data = {'kind': 'delta', 'patch': jsonpatch.make_patch(previous, document).patch}
+
+        version = ReportVersion(
+            report_id=report.id,
+            version_number=version_number,
+            data_snapshot=data,
+            created_by=created_by,
+            notes=notes
+        )
+        db.add(version)
+        db.flush()
+
+        logger.info(f"Captured version {version_number} ({data['kind']}) of report {report.id}")
+        return version
+
+    def reconstruct(self, db: Session, report_id: int, version_number: int) -> Dict[str, Any]:
+        """
+        Rebuild the document of a version from its base and deltas
+
+        Raises:
+            VersionNotFoundError: If the version (or its chain) is missing
+        """
+        base_number = version_number - (version_number - 1) % BASE_INTERVAL
+        chain = db.query(ReportVersion.version_number, ReportVersion.data_snapshot).filter(
+            ReportVersion.report_id == report_id,
+            ReportVersion.version_number.between(base_number, version_number)
+        ).order_by(ReportVersion.version_number).all()
+
+        if len(chain) != version_number - base_number + 1 or chain[0].data_snapshot.get('kind') != 'base':
+            raise VersionNotFoundError(f"Version {version_number} of report {report_id} not found")
+
+        document = chain[0].data_snapshot['document']
+        for row in chain[1:]:
+            document = jsonpatch.apply_patch(document, row.data_snapshot['patch'])
+        return document
+
+    def diff(self, db: Session, report_id: int, from_version: int, to_version: int) -> List[Dict[str, Any]]:
+        """JSON Patch operations turning one version's document into another's"""
+        return jsonpatch.make_patch(
+            self.reconstruct(db, report_id, from_version),
+            self.reconstruct(db, report_id, to_version)
+        ).patch
+
+    def version_info(self, version: ReportVersion) -> Dict[str, Any]:
+        """Metadata of a version (as returned by list_versions)"""
+        return {
+            'id': version.id,
+            'version_number': version.version_number,
+            'kind': version.data_snapshot['kind'],
+            'created_by': version.created_by,
+            'created_at': version.created_at,
+            'notes': version.notes
+        }
+
+    def list_versions(self, db: Session, report_id: int) -> List[Dict[str, Any]]:
+        """Version metadata, newest first (payloads are not loaded)"""
+        rows = db.query(
+            ReportVersion.id,
+            ReportVersion.version_number,
+            ReportVersion.data_snapshot['kind'].astext.label('kind'),
+            ReportVersion.created_by,
+            ReportVersion.created_at,
+            ReportVersion.notes
+        ).filter(
+            ReportVersion.report_id == report_id
+        ).order_by(ReportVersion.version_number.desc()).all()
+        return [dict(row._mapping) for row in rows]
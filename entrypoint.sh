@@ -25,6 +25,11 @@ echo "🗄️  Initializing database..."
 cd /app/backend && python -m app.init_db || echo "⚠️  Database init failed (may already exist)"
 echo ""
 
+# Apply schema migrations to existing tables (indexes, new columns)
+echo "🔄 Running database migrations..."
+cd /app/backend && alembic upgrade head || echo "⚠️  Database migrations failed"
+echo ""
+
 # Start FastAPI server
 PORT=${PORT:-8030}
 echo "🌐 Starting ReportForge API Server on port $PORT..."